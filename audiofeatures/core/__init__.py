@@ -3,17 +3,25 @@
 包含音频文件读取、元数据获取、分帧与窗函数等基础能力。
 """
 
+from . import audio_cache
 from . import audio_loader
 from . import signal_processing
 
-from .audio_loader import load_audio, get_audio_info
-from .signal_processing import frame_signal, apply_window
+from .audio_cache import AudioCache
+from .audio_loader import load_audio, iter_audio_blocks, get_audio_info, get_audio_info_many
+from .signal_processing import frame_signal, frame_energy, frame_autocorrelation, apply_window
 
 __all__ = [
+    "audio_cache",
     "audio_loader",
     "signal_processing",
+    "AudioCache",
     "load_audio",
+    "iter_audio_blocks",
     "get_audio_info",
+    "get_audio_info_many",
     "frame_signal",
+    "frame_energy",
+    "frame_autocorrelation",
     "apply_window"
 ]
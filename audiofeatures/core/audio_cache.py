@@ -0,0 +1,197 @@
+"""已解码音频的缓存。
+
+按文件身份与读取参数缓存 :func:`load_audio` 的结果：内存层为按字节数限额的
+LRU，可选的磁盘层将 ``float32`` 数组存为 ``.npy`` 并以内存映射方式读回。
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+
+class AudioCache:
+    """解码/重采样后音频的两级缓存。
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        内存层容量（字节）。超出时按最近最少使用淘汰；单个超过容量的条目
+        不进入内存层。为 0 时只使用磁盘层。
+    cache_dir : str or None, optional
+        磁盘层目录。为 ``None`` 时不落盘。
+
+    Attributes
+    ----------
+    hits : int
+        命中次数（内存层或磁盘层）。
+    misses : int
+        未命中次数。
+    current_bytes : int
+        内存层当前占用的字节数。
+
+    Notes
+    -----
+    - 缓存键为 ``(绝对路径, mtime_ns, 文件大小, sr, mono, offset, duration,
+      res_type)``，文件被修改后旧条目自然失效。
+    - 返回的数组为只读且在调用方之间共享，需要修改时请先 ``copy()``。
+    - 磁盘层不做容量限制，可通过 ``clear(disk=True)`` 清理；写入先写临时文件再
+      原子替换，多个进程可共享同一目录。
+    - 序列化（如传入进程池）时只保留配置与磁盘层，不复制内存层条目。
+
+    Examples
+    --------
+    >>> cache = AudioCache(max_bytes=256 * 1024 ** 2, cache_dir=".audio_cache")
+    >>> audio, sr = load_audio("example.mp3", sr=16000, cache=cache)
+    """
+
+    def __init__(self, max_bytes=512 * 1024 ** 2, cache_dir=None):
+        """初始化缓存。"""
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(file_path, sr, mono, offset, duration, res_type):
+        """由文件身份与读取参数生成缓存键。"""
+        path = os.path.abspath(os.fspath(file_path))
+        stat = os.stat(path)
+        return (
+            path,
+            stat.st_mtime_ns,
+            stat.st_size,
+            sr,
+            bool(mono),
+            float(offset),
+            None if duration is None else float(duration),
+            res_type
+        )
+
+    def get(self, key):
+        """查询缓存，未命中时返回 ``None``。
+
+        Returns
+        -------
+        tuple or None
+            ``(audio, sr)``，``audio`` 为只读数组。
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read_disk(key)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self._store(key, entry)
+        return entry
+
+    def put(self, key, audio, sr):
+        """写入缓存。
+
+        Returns
+        -------
+        tuple
+            ``(audio, sr)``，``audio`` 为写入缓存的只读数组。
+        """
+        audio = np.array(audio, dtype=np.float32, copy=True)
+        audio.flags.writeable = False
+        entry = (audio, sr)
+        self._write_disk(key, audio, sr)
+        with self._lock:
+            self._store(key, entry)
+        return entry
+
+    def fetch(self, key, loader):
+        """命中时返回缓存结果，否则调用 ``loader()`` 并写入缓存。"""
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+        audio, sr = loader()
+        return self.put(key, audio, sr)
+
+    def clear(self, disk=False):
+        """清空内存层；``disk=True`` 时同时删除磁盘层文件。"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+        if disk and self.cache_dir is not None:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith((".npy", ".json")):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        return {"max_bytes": self.max_bytes, "cache_dir": self.cache_dir}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _store(self, key, entry):
+        size = entry[0].nbytes
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous[0].nbytes
+        if size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.nbytes
+
+    def _disk_path(self, key):
+        digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, digest)
+
+    def _read_disk(self, key):
+        if self.cache_dir is None:
+            return None
+        base = self._disk_path(key)
+        try:
+            with open(base + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            audio = np.load(base + ".npy", mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        return audio, meta["sr"]
+
+    def _write_disk(self, key, audio, sr):
+        if self.cache_dir is None:
+            return
+        base = self._disk_path(key)
+        _atomic_write(base + ".npy", lambda f: np.save(f, audio))
+        meta = {"sr": sr, "key": [str(part) for part in key]}
+        _atomic_write(base + ".json", lambda f: f.write(json.dumps(meta).encode("utf-8")))
+
+
+def _atomic_write(path, write):
+    """先写入同目录临时文件再原子替换，避免读到半写入的文件。"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
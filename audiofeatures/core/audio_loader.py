@@ -1,16 +1,305 @@
 """音频加载与元信息读取。
 
 提供统一的音频读取接口以及基础元数据提取能力，解码依赖 ``librosa``，
-无损格式元信息优先使用 ``soundfile``。
+无损格式元信息优先使用 ``soundfile``。原采样率读取 PCM/浮点 WAV 时直接内存映射
+数据块，不经过完整解码。
 """
 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+import math
+import struct
+
 import librosa
 import numpy as np
 import os
+import scipy.signal
 import soundfile as sf
+import soxr
+
+RES_TYPES = ("soxr_vhq", "soxr_hq", "soxr_mq", "soxr_lq", "soxr_qq", "polyphase", "fft")
+
+_WavLayout = namedtuple(
+    "_WavLayout",
+    ["sr", "channels", "dtype", "data_offset", "n_frames"]
+)
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_WAV_DTYPES = {
+    (_WAVE_FORMAT_PCM, 8): np.dtype("u1"),
+    (_WAVE_FORMAT_PCM, 16): np.dtype("<i2"),
+    (_WAVE_FORMAT_PCM, 32): np.dtype("<i4"),
+    (_WAVE_FORMAT_IEEE_FLOAT, 32): np.dtype("<f4"),
+    (_WAVE_FORMAT_IEEE_FLOAT, 64): np.dtype("<f8")
+}
+
+
+def _parse_wav_header(file_path):
+    """解析 RIFF/WAVE 头，返回可直接内存映射的数据布局。
+
+    仅支持 8/16/32 位整数 PCM 与 32/64 位浮点（含 ``WAVE_FORMAT_EXTENSIBLE``）；
+    其他格式（如 24 位 PCM、压缩编码）或头部异常时返回 ``None``，由调用方回退到
+    常规解码。
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+
+        fmt = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk)
+            if chunk_id == b"fmt ":
+                fmt = f.read(chunk_size)
+                if len(fmt) < 16:
+                    return None
+            elif chunk_id == b"data":
+                break
+            else:
+                f.seek(chunk_size, os.SEEK_CUR)
+            if chunk_size % 2:
+                f.seek(1, os.SEEK_CUR)
+        data_offset = f.tell()
+
+    if fmt is None:
+        return None
+    format_tag, channels, sr, _, block_align, bits = struct.unpack("<HHIIHH", fmt[:16])
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE:
+        if len(fmt) < 26:
+            return None
+        format_tag = struct.unpack("<H", fmt[24:26])[0]
+    dtype = _WAV_DTYPES.get((format_tag, bits))
+    if dtype is None or channels == 0 or block_align != channels * dtype.itemsize:
+        return None
+
+    # 流式写出的文件可能把数据块长度记为 0 或 0xFFFFFFFF，以实际文件大小为准
+    available = file_size - data_offset
+    if chunk_size == 0 or chunk_size > available:
+        chunk_size = available
+    return _WavLayout(sr, channels, dtype, data_offset, chunk_size // block_align)
+
+
+def _to_float32(samples):
+    """按 ``soundfile`` 的约定将 PCM 样本缩放为 ``float32``。"""
+    if samples.dtype == np.float32:
+        return samples
+    if samples.dtype == np.uint8:
+        return (samples.astype(np.float32) - 128.0) / np.float32(128.0)
+    if samples.dtype.kind == "i":
+        scale = np.float32(2.0 ** (8 * samples.dtype.itemsize - 1))
+        return samples.astype(np.float32) / scale
+    return samples.astype(np.float32)
+
+
+def _load_wav_mmap(file_path, layout, mono, offset, duration):
+    """内存映射读取 WAV 数据块，仅转换 ``offset``/``duration`` 选中的片段。"""
+    start = min(int(offset * layout.sr), layout.n_frames) if offset else 0
+    stop = layout.n_frames
+    if duration is not None:
+        stop = min(stop, start + int(duration * layout.sr))
+
+    if stop <= start:
+        data = np.zeros((0, layout.channels), dtype=layout.dtype)
+    else:
+        data = np.memmap(
+            file_path,
+            dtype=layout.dtype,
+            mode="r",
+            offset=layout.data_offset,
+            shape=(layout.n_frames, layout.channels)
+        )
+        data = np.asarray(data[start:stop])
+
+    audio = _to_float32(data)
+    if layout.channels == 1:
+        audio = audio[:, 0]
+    elif mono:
+        audio = np.mean(audio, axis=1, dtype=np.float32)
+    else:
+        audio = audio.T
+    return audio, layout.sr
+
+
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000)
+}
+_MP3_SYNC_SEARCH_BYTES = 1 << 16
+
+_Mp3Frame = namedtuple(
+    "_Mp3Frame",
+    ["version", "sr", "channels", "samples", "length", "side_info"]
+)
+
+
+def _parse_mp3_frame_header(header):
+    """解析 4 字节 MPEG Layer III 帧头，非法时返回 ``None``。"""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sr_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sr_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    sr = _MP3_SAMPLE_RATES[version][sr_index]
+    bitrate = _MP3_BITRATES[1 if mpeg1 else 2][bitrate_index] * 1000
+    padding = (header[2] >> 1) & 0x01
+    channels = 1 if header[3] >> 6 == 3 else 2
+    samples = 1152 if mpeg1 else 576
+    length = (144 if mpeg1 else 72) * bitrate // sr + padding
+    if mpeg1:
+        side_info = 17 if channels == 1 else 32
+    else:
+        side_info = 9 if channels == 1 else 17
+    return _Mp3Frame(version, sr, channels, samples, length, side_info)
+
+
+def _skip_id3v2(data):
+    """返回 ID3v2 标签之后的字节偏移。"""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
 
 
-def load_audio(file_path, sr=None, mono=True, offset=0.0, duration=None):
+def _find_first_mp3_frame(f, start):
+    """从 ``start`` 起搜索第一个连续两帧帧头一致的同步位置。"""
+    f.seek(start)
+    data = f.read(_MP3_SYNC_SEARCH_BYTES)
+    position = data.find(b"\xff")
+    while 0 <= position < len(data) - 4:
+        frame = _parse_mp3_frame_header(data[position:position + 4])
+        if frame is not None:
+            following = position + frame.length
+            if following + 4 > len(data):
+                return start + position, frame
+            nxt = _parse_mp3_frame_header(data[following:following + 4])
+            if nxt is not None and (nxt.version, nxt.sr) == (frame.version, frame.sr):
+                return start + position, frame
+        position = data.find(b"\xff", position + 1)
+    return None, None
+
+
+def _parse_mp3_info(file_path):
+    """仅读取帧头与 Xing/Info/VBRI/LAME 标签获取 MP3 元信息。
+
+    存在 Xing/Info 或 VBRI 标签时直接读取帧数，并按 LAME 标签中的编码器
+    延迟与尾部填充扣除无效样本；否则逐帧跳读帧头计数，不做解码。
+    无法识别时返回 ``None``。
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        audio_start = _skip_id3v2(f.read(10))
+        position, frame = _find_first_mp3_frame(f, audio_start)
+        if frame is None:
+            return None
+
+        f.seek(position)
+        first = f.read(max(frame.length, 4 + 32 + 200))
+        n_frames = None
+        delay = padding = 0
+
+        xing = 4 + frame.side_info
+        if first[xing:xing + 4] in (b"Xing", b"Info"):
+            flags = struct.unpack(">I", first[xing + 4:xing + 8])[0]
+            cursor = xing + 8
+            if flags & 0x1:
+                n_frames = struct.unpack(">I", first[cursor:cursor + 4])[0]
+                cursor += 4
+            if flags & 0x2:
+                cursor += 4
+            if flags & 0x4:
+                cursor += 100
+            if flags & 0x8:
+                cursor += 4
+            lame = first[cursor:cursor + 24]
+            if len(lame) == 24 and lame[:4] in (b"LAME", b"Lavf", b"Lavc"):
+                delay = (lame[21] << 4) | (lame[22] >> 4)
+                padding = ((lame[22] & 0x0F) << 8) | lame[23]
+        elif first[36:40] == b"VBRI":
+            n_frames = struct.unpack(">I", first[50:54])[0]
+
+        if n_frames is None:
+            n_frames = 0
+            while position + 4 <= file_size:
+                f.seek(position)
+                current = _parse_mp3_frame_header(f.read(4))
+                if current is None:
+                    break
+                n_frames += 1
+                position += current.length
+
+    samples = max(n_frames * frame.samples - delay - padding, 0)
+    return {
+        "sr": frame.sr,
+        "channels": frame.channels,
+        "duration": samples / float(frame.sr),
+        "samples": samples,
+        "format": "mp3",
+        "bit_depth": None
+    }
+
+
+@lru_cache(maxsize=64)
+def _polyphase_filter(up, down):
+    """设计并缓存 ``resample_poly`` 默认的 Kaiser 低通 FIR（``float32``）。
+
+    与 ``scipy.signal.resample_poly(window=("kaiser", 5.0))`` 内部设计一致，
+    缓存后同一采样率对只设计一次。返回只读数组。
+    """
+    max_rate = max(up, down)
+    taps = scipy.signal.firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    taps = taps.astype(np.float32)
+    taps.flags.writeable = False
+    return taps
+
+
+def _resample(audio, orig_sr, target_sr, res_type):
+    """沿最后一轴重采样，输出长度为 ``ceil(n * target_sr / orig_sr)``。"""
+    if res_type != "polyphase":
+        return librosa.resample(audio, orig_sr=orig_sr, target_sr=target_sr, res_type=res_type)
+    if int(orig_sr) != orig_sr or int(target_sr) != target_sr:
+        raise ValueError("polyphase resampling requires integer sample rates")
+    gcd = math.gcd(int(orig_sr), int(target_sr))
+    up, down = int(target_sr) // gcd, int(orig_sr) // gcd
+    resampled = scipy.signal.resample_poly(
+        audio, up, down, axis=-1, window=_polyphase_filter(up, down)
+    )
+    return librosa.util.fix_length(
+        resampled, size=int(np.ceil(audio.shape[-1] * target_sr / float(orig_sr))), axis=-1
+    )
+
+
+def load_audio(
+    file_path,
+    sr=None,
+    mono=True,
+    offset=0.0,
+    duration=None,
+    mmap=True,
+    res_type="soxr_hq",
+    cache=None
+):
     """加载音频文件。
 
     Parameters
@@ -25,6 +314,15 @@ def load_audio(file_path, sr=None, mono=True, offset=0.0, duration=None):
         起始读取时间（秒）。
     duration : float or None, optional
         读取时长（秒）。为 ``None`` 时读取全部。
+    mmap : bool, optional
+        是否对 PCM/浮点 WAV 启用内存映射快速路径。
+    res_type : str, optional
+        重采样方法，仅在 ``sr`` 与原采样率不同时生效。按质量从高到低为
+        ``soxr_vhq``、``soxr_hq``（默认，与 ``librosa`` 一致）、``soxr_mq``、
+        ``soxr_lq``、``soxr_qq``；``polyphase`` 为 ``scipy`` 多相滤波，滤波器
+        按采样率对缓存；``fft`` 为频域重采样。
+    cache : AudioCache or None, optional
+        解码结果缓存。命中时跳过解码与重采样，返回缓存中的只读数组。
 
     Returns
     -------
@@ -34,6 +332,8 @@ def load_audio(file_path, sr=None, mono=True, offset=0.0, duration=None):
 
     Raises
     ------
+    ValueError
+        ``res_type`` 不支持时抛出。
     Exception
         读取失败时抛出异常。
 
@@ -41,6 +341,13 @@ def load_audio(file_path, sr=None, mono=True, offset=0.0, duration=None):
     -----
     - MP3 等有损格式的解码依赖系统后端（如 ffmpeg）。
     - 大文件建议使用 ``offset`` 与 ``duration`` 控制内存占用。
+    - 8/16/32 位 PCM 或浮点 WAV 的数据块通过 ``np.memmap`` 映射，只读取并转换
+      ``offset``/``duration`` 选中的样本（需要重采样时再对该片段重采样）；
+      原采样率读取 ``float32`` WAV 时直接返回映射内存上的只读视图：单声道或
+      ``mono=False`` 的多声道文件均如此，多声道时为 ``(channels, n_samples)``
+      的转置视图（非 C 连续）。需要修改时请先 ``copy()``。缩放方式与 ``soundfile`` 一致，结果与常规解码相同。
+    - 44.1 kHz → 16 kHz 时 ``soxr_qq`` 约比 ``soxr_hq`` 快一倍；各档吞吐量见
+      ``benchmarks/bench_resample.py``。
 
     Examples
     --------
@@ -49,20 +356,149 @@ def load_audio(file_path, sr=None, mono=True, offset=0.0, duration=None):
     >>> audio.shape, sr
     ((16000,), 16000)
     """
-    try:
-        audio, sample_rate = librosa.load(
-            path=file_path,
+    if res_type not in RES_TYPES:
+        raise ValueError(f"res_type must be one of {RES_TYPES}")
+    if cache is not None:
+        try:
+            key = cache.make_key(file_path, sr, mono, offset, duration, res_type)
+        except Exception as e:
+            raise Exception(f"加载音频文件失败 '{file_path}': {str(e)}")
+        return cache.fetch(key, lambda: load_audio(
+            file_path,
             sr=sr,
             mono=mono,
             offset=offset,
             duration=duration,
-            dtype=np.float32
-        )
+            mmap=mmap,
+            res_type=res_type
+        ))
+    try:
+        layout = None
+        if (
+            mmap
+            and isinstance(file_path, (str, os.PathLike))
+            and os.path.splitext(file_path)[1].lower() == ".wav"
+        ):
+            layout = _parse_wav_header(file_path)
+
+        if layout is not None:
+            audio, sample_rate = _load_wav_mmap(file_path, layout, mono, offset, duration)
+        else:
+            audio, sample_rate = librosa.load(
+                path=file_path,
+                sr=None,
+                mono=mono,
+                offset=offset,
+                duration=duration,
+                dtype=np.float32
+            )
+        if sr is not None and sr != sample_rate:
+            audio = _resample(audio, sample_rate, sr, res_type)
+            sample_rate = sr
         return np.asarray(audio, dtype=np.float32), sample_rate
     except Exception as e:
         raise Exception(f"加载音频文件失败 '{file_path}': {str(e)}")
 
 
+def iter_audio_blocks(file_path, block_size, overlap=0, sr=None, mono=True):
+    """按块流式读取音频，峰值内存只与块大小有关。
+
+    Parameters
+    ----------
+    file_path : str
+        音频文件路径，需为 ``soundfile`` 可读格式。
+    block_size : int
+        每块的样本数（按输出采样率计）。
+    overlap : int, optional
+        相邻块之间重叠的样本数，需小于 ``block_size``。
+    sr : int or None, optional
+        目标采样率。为 ``None`` 时保持原采样率。
+    mono : bool, optional
+        是否转换为单声道。
+
+    Yields
+    ------
+    ndarray
+        ``float32`` 音频块。``mono=True`` 时为一维，否则形状为
+        ``(channels, samples)``，与 :func:`load_audio` 一致。除最后一块外
+        每块长度均为 ``block_size``；最后一块只包含剩余样本。
+
+    Raises
+    ------
+    ValueError
+        参数非法时抛出。
+
+    Notes
+    -----
+    文件通过 ``soundfile.blocks`` 逐块读取；需要重采样时使用
+    ``soxr.ResampleStream``（与 ``librosa`` 默认的 ``soxr_hq`` 相同质量），
+    滤波器状态在块之间保留，因此去掉重叠后各块拼接的结果与
+    ``load_audio(file_path, sr=sr, mono=mono)`` 一致，块边界处没有接缝。
+
+    Examples
+    --------
+    >>> for block in iter_audio_blocks("long.wav", block_size=16000, sr=16000):
+    ...     process(block)
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be > 0")
+    if not 0 <= overlap < block_size:
+        raise ValueError("overlap must be in [0, block_size)")
+
+    step = block_size - overlap
+    with sf.SoundFile(file_path) as f:
+        native_sr = f.samplerate
+        channels = 1 if mono else f.channels
+        resampler = None
+        read_size = step
+        if sr is not None and sr != native_sr:
+            resampler = soxr.ResampleStream(native_sr, sr, channels, dtype="float32", quality="HQ")
+            read_size = max(1, int(np.ceil(step * native_sr / float(sr))))
+
+        buffer = np.zeros((0, channels), dtype=np.float32)
+        emitted = False
+        n_input = n_output = 0
+        blocks = f.blocks(read_size, dtype="float32", always_2d=True)
+        for block, last in chain(
+            ((block, False) for block in blocks),
+            [(np.zeros((0, f.channels), dtype=np.float32), True)]
+        ):
+            if mono and block.shape[1] > 1:
+                block = np.mean(block, axis=1, dtype=np.float32, keepdims=True)
+            if resampler is not None:
+                n_input += block.shape[0]
+                block = resampler.resample_chunk(block, last=last)
+                if last:
+                    # 与 librosa.resample 一致，总长度补齐/截断为 ceil(n * sr / native_sr)
+                    target = int(np.ceil(n_input * sr / float(native_sr)))
+                    block = block[:max(target - n_output, 0)]
+                    pad = max(target - n_output - block.shape[0], 0)
+                    block = np.concatenate((block, np.zeros((pad, channels), np.float32)))
+                n_output += block.shape[0]
+            buffer = np.concatenate((buffer, block))
+
+            while buffer.shape[0] >= block_size:
+                yield _block_layout(buffer[:block_size], mono)
+                emitted = True
+                buffer = buffer[step:]
+
+        if buffer.shape[0] > (overlap if emitted else 0):
+            yield _block_layout(buffer, mono)
+
+
+def _block_layout(block, mono):
+    block = np.ascontiguousarray(block.T)
+    return block[0] if mono else block
+
+
+def _subtype_bit_depth(subtype):
+    """由 ``soundfile`` 子类型推断位深度。"""
+    for bits in (16, 24, 32, 8):
+        if str(bits) in subtype:
+            return bits
+    return None
+
+
 def get_audio_info(file_path):
     """获取音频文件的基础元数据。
 
@@ -85,48 +521,96 @@ def get_audio_info(file_path):
     Notes
     -----
     - WAV/FLAC/OGG/AIFF 等无损格式使用 ``soundfile`` 读取。
-    - MP3 等格式通过解码后的样本估算时长与通道数。
+    - MP3 只解析帧头与 Xing/Info/VBRI/LAME 标签（无标签时逐帧跳读帧头），
+      不解码音频；样本数已扣除 LAME 标签记录的编码器延迟与填充。
+    - 其他格式先尝试 ``soundfile`` 读取文件头，失败时才解码后统计时长与通道数。
     """
     try:
         file_format = os.path.splitext(file_path)[1].lower().replace(".", "")
 
-        info = {}
-
-        if file_format in ["wav", "flac", "ogg", "aiff"]:
-            sf_info = sf.info(file_path)
-            info["sr"] = sf_info.samplerate
-            info["channels"] = sf_info.channels
-            info["duration"] = sf_info.duration
-            info["samples"] = sf_info.frames
-            info["format"] = file_format
-
-            if hasattr(sf_info, "subtype"):
-                if "16" in sf_info.subtype:
-                    info["bit_depth"] = 16
-                elif "24" in sf_info.subtype:
-                    info["bit_depth"] = 24
-                elif "32" in sf_info.subtype:
-                    info["bit_depth"] = 32
-                elif "8" in sf_info.subtype:
-                    info["bit_depth"] = 8
-                else:
-                    info["bit_depth"] = None
-            else:
-                info["bit_depth"] = None
+        if file_format == "mp3":
+            info = _parse_mp3_info(file_path)
+            if info is not None:
+                return info
+        elif file_format in ["wav", "flac", "ogg", "aiff"]:
+            return _soundfile_info(file_path, file_format)
         else:
-            y, sr = librosa.load(file_path, sr=None, mono=False)
+            try:
+                return _soundfile_info(file_path, file_format)
+            except RuntimeError:
+                pass
 
-            if y.ndim > 1:
-                info["channels"] = y.shape[0]
-            else:
-                info["channels"] = 1
+        y, sr = librosa.load(file_path, sr=None, mono=False)
 
-            info["sr"] = sr
-            info["duration"] = librosa.get_duration(y=y, sr=sr)
-            info["samples"] = y.shape[-1]
-            info["format"] = file_format
-            info["bit_depth"] = None
+        info = {}
+        if y.ndim > 1:
+            info["channels"] = y.shape[0]
+        else:
+            info["channels"] = 1
 
+        info["sr"] = sr
+        info["duration"] = librosa.get_duration(y=y, sr=sr)
+        info["samples"] = y.shape[-1]
+        info["format"] = file_format
+        info["bit_depth"] = None
         return info
     except Exception as e:
         raise Exception(f"获取音频信息失败 '{file_path}': {str(e)}")
+
+
+def _soundfile_info(file_path, file_format):
+    sf_info = sf.info(file_path)
+    return {
+        "sr": sf_info.samplerate,
+        "channels": sf_info.channels,
+        "duration": sf_info.duration,
+        "samples": sf_info.frames,
+        "format": file_format,
+        "bit_depth": _subtype_bit_depth(getattr(sf_info, "subtype", "") or "")
+    }
+
+
+def _audio_info_or_error(file_path):
+    try:
+        return get_audio_info(file_path)
+    except Exception as e:
+        return e
+
+
+def get_audio_info_many(paths, n_workers=None):
+    """并行获取多个音频文件的元数据。
+
+    Parameters
+    ----------
+    paths : iterable of str
+        音频文件路径。
+    n_workers : int or None, optional
+        工作线程数，默认 ``min(32, os.cpu_count() + 4)``。为 1 时顺序执行。
+
+    Returns
+    -------
+    list
+        与 ``paths`` 顺序一致的列表；成功时为 :func:`get_audio_info` 的字典，
+        失败时为对应的异常对象，单个文件出错不会中断整批处理。
+
+    Raises
+    ------
+    ValueError
+        ``n_workers`` 非法时抛出。
+
+    Notes
+    -----
+    元信息读取以文件头 I/O 为主，使用线程池即可并行，无需进程间传输。
+
+    Examples
+    --------
+    >>> infos = get_audio_info_many(["a.mp3", "b.wav"], n_workers=8)
+    >>> [info["duration"] for info in infos if isinstance(info, dict)]
+    """
+    paths = list(paths)
+    if n_workers is not None and n_workers < 1:
+        raise ValueError("n_workers must be >= 1")
+    if n_workers == 1:
+        return [_audio_info_or_error(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(_audio_info_or_error, paths))
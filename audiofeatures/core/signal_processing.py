@@ -1,12 +1,19 @@
 """信号分帧与窗函数处理。"""
 
+import math
+
 import numpy as np
+from scipy import fft as scipy_fft
 from scipy import signal as scipy_signal
 
 from audiofeatures.utils.contract import ensure_float32
 
+_ENERGY_CHUNK = 1 << 16
+_ENERGY_BLOCK = 1024
+_ENERGY_DIRECT_UNITS = 8
+
 
-def frame_signal(signal, frame_length, hop_length, center=True):
+def frame_signal(signal, frame_length, hop_length, center=True, copy=False):
     """将一维信号切分为重叠帧。
 
     Parameters
@@ -19,6 +26,8 @@ def frame_signal(signal, frame_length, hop_length, center=True):
         帧移（样本数）。
     center : bool, optional
         是否居中对齐。为 ``True`` 时在两端补零。
+    copy : bool, optional
+        是否返回独立的可写副本。默认返回基于步长的只读视图。
 
     Returns
     -------
@@ -33,6 +42,9 @@ def frame_signal(signal, frame_length, hop_length, center=True):
     Notes
     -----
     当 ``center=False`` 且信号长度不足一个帧时返回空数组；``center=True`` 会在两端补零并至少返回一帧。
+
+    默认返回的视图与输入（或补零后的信号）共享内存，分帧本身不复制样本；
+    视图为只读，需要原地修改帧时请传入 ``copy=True``。
     """
     signal = ensure_float32(signal)
     if signal.ndim != 1:
@@ -48,14 +60,164 @@ def frame_signal(signal, frame_length, hop_length, center=True):
     if len(signal) < frame_length:
         return np.zeros((0, frame_length), dtype=signal.dtype)
     num_frames = (len(signal) - frame_length) // hop_length + 1
-    frames = np.zeros((num_frames, frame_length), dtype=signal.dtype)
-
-    for i in range(num_frames):
-        start = i * hop_length
-        frames[i] = signal[start:start + frame_length]
+    stride = signal.strides[0]
+    frames = np.lib.stride_tricks.as_strided(
+        signal,
+        shape=(num_frames, frame_length),
+        strides=(hop_length * stride, stride),
+        writeable=False
+    )
+    if copy:
+        return frames.copy()
     return frames
 
 
+def frame_energy(signal, frame_length, hop_length, center=True):
+    """计算每帧样本平方和。
+
+    Parameters
+    ----------
+    signal : ndarray
+        一维输入信号。
+    frame_length : int
+        帧长度（样本数）。
+    hop_length : int
+        帧移（样本数）。
+    center : bool, optional
+        是否居中对齐，分帧方式与 :func:`frame_signal` 一致。
+
+    Returns
+    -------
+    ndarray
+        每帧能量，形状为 ``(n_frames,)``，``float64``。
+
+    Raises
+    ------
+    ValueError
+        输入非一维或参数非法时抛出。
+
+    Notes
+    -----
+    先以 ``float64`` 求每 ``gcd(frame_length, hop_length, pad)`` 个样本的平方和，
+    再对其做累积和并在帧边界处做差，复杂度为 ``O(n_samples)``，与帧重叠
+    程度无关；每帧只含不超过 8 个这样的单元时直接相加。补零部分不贡献
+    能量，因此无需实际补零。累积和按不短于一帧的块重新开始，做差误差只与
+    帧所在的两个块的能量相关，全零区域的帧能量严格为 0，舍入产生的负值
+    截断为 0。
+    """
+    signal = ensure_float32(signal)
+    if signal.ndim != 1:
+        raise ValueError("输入信号必须是一维数组")
+    if frame_length <= 0:
+        raise ValueError("frame_length must be > 0")
+    if hop_length <= 0:
+        raise ValueError("hop_length must be > 0")
+
+    pad_length = frame_length // 2 if center else 0
+    padded_length = len(signal) + 2 * pad_length
+    if padded_length < frame_length:
+        return np.zeros(0, dtype=np.float64)
+    num_frames = (padded_length - frame_length) // hop_length + 1
+
+    # 帧边界都落在 unit 的整数倍上，先分块求每 unit 个样本的平方和；
+    # 分块让 float64 平方值留在缓存中，不必分配与信号等长的 float64 数组
+    unit = math.gcd(frame_length, hop_length, pad_length)
+    window = frame_length // unit
+    hop_units = hop_length // unit
+    pad_units = pad_length // unit
+    n_units = -(-len(signal) // unit)
+    units = np.zeros(n_units + 2 * window, dtype=np.float64)
+    units_per_chunk = max(1, _ENERGY_CHUNK // unit)
+    buffer = np.empty(units_per_chunk * unit, dtype=np.float64)
+    for first in range(0, n_units, units_per_chunk):
+        chunk = signal[first * unit:(first + units_per_chunk) * unit]
+        count = -(-len(chunk) // unit)
+        squares = buffer[:count * unit]
+        squares[len(chunk):] = 0.0
+        np.square(chunk, out=squares[:len(chunk)], dtype=np.float64)
+        out = units[window + first:window + first + count]
+        if unit > 1:
+            squares.reshape(count, unit).sum(axis=1, out=out)
+        else:
+            out[:] = squares
+
+    # units 两端各留 window 个零，第 k 帧覆盖 units[first + k * hop_units, +window)
+    first = window - pad_units
+    span = (num_frames - 1) * hop_units + 1
+    if window <= _ENERGY_DIRECT_UNITS:
+        # 每帧只含少量单元时直接相加，没有做差带来的误差
+        values = units[first:first + span:hop_units].copy()
+        for offset in range(1, window):
+            values += units[first + offset:first + offset + span:hop_units]
+        return values
+
+    # 累积和每 block（不少于一帧）个单元重新开始：partial[k, j] 为块 k 前 j 个
+    # 单元之和，block_totals[k] 为块 k 的总和。一帧至多跨两个块，误差只与这两块
+    # 的能量有关，全零区域的帧能量严格为 0。
+    block = max(window, -(-_ENERGY_BLOCK // unit))
+    n_blocks = len(units) // block + 1
+    partial = np.zeros((n_blocks, block), dtype=np.float64)
+    cumulative = partial.reshape(-1)
+    cumulative[1:len(units) + 1] = units
+    carry = partial[1:, 0].copy()
+    partial[:, 0] = 0.0
+    np.cumsum(partial, axis=1, out=partial)
+    block_totals = partial[:-1, -1] + carry
+
+    starts = np.arange(first, first + span, hop_units)
+    ends = starts + window
+    values = cumulative[ends] - cumulative[starts]
+    crosses = ends // block > starts // block
+    values[crosses] += block_totals[starts[crosses] // block]
+    np.maximum(values, 0.0, out=values)
+    return values
+
+
+def frame_autocorrelation(frames, max_lag=None):
+    """批量计算每帧的自相关函数。
+
+    Parameters
+    ----------
+    frames : ndarray
+        二维分帧数组，形状 ``(n_frames, frame_length)``。
+    max_lag : int or None, optional
+        最大滞后（样本数），默认 ``frame_length - 1``。
+
+    Returns
+    -------
+    ndarray
+        自相关，形状为 ``(n_frames, max_lag + 1)``。``float32`` 输入保持
+        ``float32`` 精度，其余输入按 ``float64`` 计算。
+        第 ``k`` 列为 ``sum(frame[j] * frame[j + k])``。
+
+    Raises
+    ------
+    ValueError
+        输入维度或 ``max_lag`` 非法时抛出。
+
+    Notes
+    -----
+    使用实数 FFT 对全部帧一次性计算（Wiener-Khinchin），FFT 长度补零到
+    ``frame_length + max_lag`` 以上以避免循环相关的混叠，复杂度为
+    ``O(n_frames * frame_length * log(frame_length))``。
+    """
+    frames = np.asarray(frames)
+    if frames.dtype != np.float32:
+        frames = frames.astype(np.float64, copy=False)
+    if frames.ndim != 2:
+        raise ValueError("输入帧必须是二维数组")
+    frame_length = frames.shape[1]
+    if max_lag is None:
+        max_lag = frame_length - 1
+    if not 0 <= max_lag < frame_length:
+        raise ValueError("max_lag must be in [0, frame_length)")
+
+    n_fft = scipy_fft.next_fast_len(frame_length + max_lag, real=True)
+    spectrum = scipy_fft.rfft(frames, n=n_fft, axis=1)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+    return scipy_fft.irfft(power, n=n_fft, axis=1)[:, :max_lag + 1]
+
+
 def apply_window(frames, window_type="hann"):
     """对分帧信号应用窗函数。
 
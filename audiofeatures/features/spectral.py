@@ -3,9 +3,11 @@
 import numpy as np
 import librosa
 
-from audiofeatures.core.signal_processing import frame_signal
+from audiofeatures.core.signal_processing import frame_autocorrelation, frame_signal
 from audiofeatures.utils.contract import ensure_float32, to_feature_matrix
 
+_FORMANT_BATCH_FRAMES = 256
+
 
 def mfcc(
     signal,
@@ -175,6 +177,44 @@ def mel_spectrogram(
     return to_feature_matrix(mel, frame_axis=1)
 
 
+def _levinson_durbin(autocorr, order):
+    """对多帧自相关同时执行 Levinson-Durbin 递推。
+
+    Parameters
+    ----------
+    autocorr : ndarray
+        自相关，形状 ``(n_frames, order + 1)``。
+    order : int
+        LPC 阶数。
+
+    Returns
+    -------
+    ndarray
+        LPC 系数 ``[1, a_1, ..., a_order]``，形状 ``(n_frames, order + 1)``。
+    """
+    n_frames = autocorr.shape[0]
+    coeffs = np.zeros((n_frames, order + 1))
+    coeffs[:, 0] = 1.0
+    error = autocorr[:, 0].copy()
+    for i in range(1, order + 1):
+        acc = autocorr[:, i] + np.sum(coeffs[:, 1:i] * autocorr[:, i - 1:0:-1], axis=1)
+        reflection = np.zeros(n_frames)
+        np.divide(-acc, error, out=reflection, where=error > 0)
+        coeffs[:, 1:i] = coeffs[:, 1:i] + reflection[:, None] * coeffs[:, i - 1:0:-1]
+        coeffs[:, i] = reflection
+        error *= 1.0 - reflection ** 2
+    return coeffs
+
+
+def _polynomial_roots(coeffs):
+    """以批量伴随矩阵特征值求多个首一多项式的根。"""
+    n_frames, degree = coeffs.shape[0], coeffs.shape[1] - 1
+    companion = np.zeros((n_frames, degree, degree))
+    companion[:, 0, :] = -coeffs[:, 1:]
+    companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1.0
+    return np.linalg.eigvals(companion)
+
+
 def formant_frequencies(signal, sr, order=12, n_formants=4):
     """估计共振峰频率（LPC）。
 
@@ -202,6 +242,10 @@ def formant_frequencies(signal, sr, order=12, n_formants=4):
     Notes
     -----
     LPC 共振峰估计对噪声敏感，结果仅供近似分析。
+
+    每帧去均值并加 Hamming 窗后使用自相关法 LPC：全部帧的自相关由 FFT
+    批量计算，Levinson-Durbin 递推在帧维度上向量化，多项式的根由堆叠
+    伴随矩阵的 ``np.linalg.eigvals`` 一次求出。
     """
     signal = ensure_float32(signal)
     if signal.ndim != 1:
@@ -220,19 +264,22 @@ def formant_frequencies(signal, sr, order=12, n_formants=4):
         return np.empty((0, n_formants))
 
     formants = np.zeros((frames.shape[0], n_formants), dtype=np.float32)
-    for i, frame in enumerate(frames):
-        frame = frame - np.mean(frame)
-        if np.allclose(frame, 0.0):
-            continue
-        try:
-            lpc_coeffs = librosa.lpc(frame, order=order)
-        except Exception:
+    if order >= frame_length:
+        return formants
+    window = np.hamming(frame_length)
+    n_keep = min(n_formants, order)
+
+    for start in range(0, frames.shape[0], _FORMANT_BATCH_FRAMES):
+        batch = frames[start:start + _FORMANT_BATCH_FRAMES].astype(np.float64)
+        batch -= np.mean(batch, axis=1, keepdims=True)
+        active = np.flatnonzero(~np.all(np.abs(batch) <= 1e-8, axis=1))
+        if active.size == 0:
             continue
-        roots = np.roots(lpc_coeffs)
-        roots = roots[np.imag(roots) >= 0]
-        angles = np.arctan2(np.imag(roots), np.real(roots))
-        freqs = angles * (sr / (2.0 * np.pi))
-        freqs = np.sort(freqs[(freqs > 0) & (freqs < sr / 2.0)])
-        if freqs.size:
-            formants[i, : min(n_formants, freqs.size)] = freqs[:n_formants]
+        autocorr = frame_autocorrelation(batch[active] * window, max_lag=order)
+        roots = _polynomial_roots(_levinson_durbin(autocorr, order))
+
+        freqs = np.arctan2(roots.imag, roots.real) * (sr / (2.0 * np.pi))
+        valid = (roots.imag >= 0) & (freqs > 0) & (freqs < sr / 2.0)
+        freqs = np.sort(np.where(valid, freqs, np.inf), axis=1)[:, :n_keep]
+        formants[start + active, :n_keep] = np.where(np.isfinite(freqs), freqs, 0.0)
     return formants
@@ -4,7 +4,7 @@ import numpy as np
 from scipy import stats
 import librosa
 
-from audiofeatures.core.signal_processing import frame_signal
+from audiofeatures.core.signal_processing import frame_energy, frame_signal
 from audiofeatures.utils.contract import ensure_float32, to_feature_matrix
 
 
@@ -64,7 +64,7 @@ def signal_statistics(signal, frame_length=2048, hop_length=512):
     min_val = np.min(frames, axis=1)
     max_val = np.max(frames, axis=1)
     range_val = max_val - min_val
-    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    rms = np.sqrt(frame_energy(signal, frame_length, hop_length, center=True) / frame_length)
 
     return {
         "mean": to_feature_matrix(mean),
@@ -1,10 +1,13 @@
 """时域特征提取函数。"""
 
 import numpy as np
+from scipy import fft as scipy_fft
 
-from audiofeatures.core.signal_processing import frame_signal
+from audiofeatures.core.signal_processing import frame_autocorrelation, frame_energy, frame_signal
 from audiofeatures.utils.contract import ensure_float32, to_feature_matrix
 
+_PITCH_BATCH_FRAMES = 64
+
 
 def zero_crossing_rate(signal, frame_length=2048, hop_length=512):
     """计算过零率（ZCR）。
@@ -68,6 +71,11 @@ def energy(signal, frame_length=2048, hop_length=512):
     ------
     ValueError
         输入维度或参数非法时抛出。
+
+    Notes
+    -----
+    由 :func:`~audiofeatures.core.signal_processing.frame_energy` 的累积和计算，
+    每个样本只平方一次。
     """
     signal = ensure_float32(signal)
     if signal.ndim != 1:
@@ -77,8 +85,7 @@ def energy(signal, frame_length=2048, hop_length=512):
     if hop_length <= 0:
         raise ValueError("hop_length must be > 0")
 
-    frames = frame_signal(signal, frame_length=frame_length, hop_length=hop_length, center=False)
-    values = np.sum(frames ** 2, axis=1)
+    values = frame_energy(signal, frame_length=frame_length, hop_length=hop_length, center=False)
     return to_feature_matrix(values)
 
 
@@ -106,7 +113,62 @@ def log_energy(signal, frame_length=2048, hop_length=512, eps=1e-10):
     return log_values.astype(np.float32, copy=False)
 
 
-def pitch(signal, sr, frame_length=2048, hop_length=512, method="autocorr"):
+def _yin_batch(frames, min_lag, max_lag, threshold):
+    """对一批帧计算 YIN 估计的滞后与累积均值归一化差分值。
+
+    返回 ``(lags, cmndf_at_lag, voiced)``，其中 ``lags`` 为插值后的浮点滞后。
+    """
+    frames = frames.astype(np.float64)
+    n_frames, frame_length = frames.shape
+    window_length = frame_length - max_lag
+    n_fft = scipy_fft.next_fast_len(frame_length, real=True)
+
+    # d(tau) = E(0) + E(tau) - 2 r(tau)，r 为前 window_length 个样本与整帧的互相关
+    spectrum = scipy_fft.rfft(frames, n=n_fft, axis=1)
+    head = scipy_fft.rfft(frames[:, :window_length], n=n_fft, axis=1)
+    cross = scipy_fft.irfft(spectrum * np.conj(head), n=n_fft, axis=1)[:, :max_lag + 1]
+    energy = np.cumsum(frames ** 2, axis=1)
+    energy = np.concatenate((np.zeros((n_frames, 1)), energy), axis=1)
+    lags = np.arange(max_lag + 1)
+    window_energy = energy[:, lags + window_length] - energy[:, lags]
+    diff = window_energy[:, :1] + window_energy - 2.0 * cross
+    np.maximum(diff, 0.0, out=diff)
+
+    cumulative = np.cumsum(diff[:, 1:], axis=1)
+    cmndf = np.ones_like(diff)
+    np.divide(
+        diff[:, 1:] * lags[1:],
+        cumulative,
+        out=cmndf[:, 1:],
+        where=cumulative > 0
+    )
+
+    band = cmndf[:, min_lag:max_lag]
+    following = cmndf[:, min_lag + 1:max_lag + 1]
+    troughs = (band < threshold) & (band <= following)
+    voiced = np.any(troughs, axis=1)
+    best = np.where(voiced, np.argmax(troughs, axis=1), np.argmin(band, axis=1)) + min_lag
+
+    rows = np.arange(n_frames)
+    previous = cmndf[rows, best - 1]
+    current = cmndf[rows, best]
+    following = cmndf[rows, best + 1]
+    curvature = previous - 2.0 * current + following
+    shift = np.zeros(n_frames)
+    np.divide(0.5 * (previous - following), curvature, out=shift, where=curvature > 0)
+    np.clip(shift, -1.0, 1.0, out=shift)
+    return best + shift, current, voiced
+
+
+def pitch(
+    signal,
+    sr,
+    frame_length=2048,
+    hop_length=512,
+    method="autocorr",
+    threshold=0.1,
+    return_confidence=False
+):
     """估计基频（音高）。
 
     Parameters
@@ -119,13 +181,22 @@ def pitch(signal, sr, frame_length=2048, hop_length=512, method="autocorr"):
         帧长度（样本数）。
     hop_length : int, optional
         帧移（样本数）。
-    method : {'autocorr', 'improved_autocorr'}, optional
-        基于自相关的两种估计方式。
+    method : {'autocorr', 'improved_autocorr', 'yin'}, optional
+        ``autocorr`` 与 ``improved_autocorr`` 为基于自相关的两种估计方式；
+        ``yin`` 使用累积均值归一化差分函数（YIN）。
+    threshold : float, optional
+        ``yin`` 的无声判决阈值，范围 ``(0, 1)``。差分函数在搜索区间内没有低于
+        该值的谷点时，该帧视为无声。
+    return_confidence : bool, optional
+        是否同时返回每帧的发声置信度。
 
     Returns
     -------
-    ndarray
-        每帧基频（Hz），形状为 ``(n_frames, 1)``。
+    ndarray or tuple
+        每帧基频（Hz），形状为 ``(n_frames, 1)``，无声帧为 0。
+        ``return_confidence=True`` 时返回 ``(pitches, confidence)``，
+        ``confidence`` 形状相同、取值 ``[0, 1]``：``yin`` 为 ``1 - d'(tau)``，
+        自相关方法为所选滞后处的归一化自相关。
 
     Raises
     ------
@@ -134,7 +205,12 @@ def pitch(signal, sr, frame_length=2048, hop_length=512, method="autocorr"):
 
     Notes
     -----
-    自相关法在噪声或多音情况下可能不稳定。
+    自相关法在噪声或多音情况下可能不稳定，``yin`` 更不易出现倍频错误。
+
+    所有帧的自相关通过实数 FFT 批量计算，滞后选取在 ``[min_lag, max_lag)``
+    区间上做向量化 ``argmax``。``yin`` 的差分函数同样由 FFT 互相关与能量
+    累积和向量化得到，并对选中的谷点做抛物线插值；其最大滞后不超过
+    ``frame_length // 2``。
     """
     signal = ensure_float32(signal)
     if signal.ndim != 1:
@@ -146,32 +222,45 @@ def pitch(signal, sr, frame_length=2048, hop_length=512, method="autocorr"):
     if hop_length <= 0:
         raise ValueError("hop_length must be > 0")
 
-    if method not in {"autocorr", "improved_autocorr"}:
-        raise ValueError("method must be 'autocorr' or 'improved_autocorr'")
+    if method not in {"autocorr", "improved_autocorr", "yin"}:
+        raise ValueError("method must be 'autocorr', 'improved_autocorr' or 'yin'")
+    if not 0 < threshold < 1:
+        raise ValueError("threshold must be in (0, 1)")
 
     frames = frame_signal(signal, frame_length=frame_length, hop_length=hop_length, center=False)
-    if frames.size == 0:
-        return np.zeros((0, 1), dtype=np.float32)
+    pitches = np.zeros(frames.shape[0], dtype=np.float32)
+    confidence = np.zeros(frames.shape[0], dtype=np.float32)
 
     min_freq = 50.0
     max_freq = min(2000.0, sr / 2.0)
     min_lag = max(1, int(sr / max_freq))
-    max_lag = min(frames.shape[1] - 1, int(sr / min_freq))
-    window = np.hanning(frame_length)
+    if method == "yin":
+        max_lag = min(frame_length // 2, int(sr / min_freq))
+    else:
+        max_lag = min(frame_length - 1, int(sr / min_freq))
+    window = np.hanning(frame_length).astype(np.float32)
 
-    pitches = np.zeros(frames.shape[0], dtype=np.float32)
-    for i, frame in enumerate(frames):
-        frame = frame - np.mean(frame)
-        if method == "improved_autocorr":
-            frame = frame * window
-        if np.allclose(frame, 0.0):
-            pitches[i] = 0.0
-            continue
-        corr = np.correlate(frame, frame, mode="full")[frame_length - 1:]
-        if max_lag <= min_lag:
-            pitches[i] = 0.0
-            continue
-        corr[:min_lag] = 0.0
-        lag = min_lag + int(np.argmax(corr[min_lag:max_lag]))
-        pitches[i] = sr / lag if lag > 0 else 0.0
+    if frames.size and max_lag > min_lag:
+        for start in range(0, frames.shape[0], _PITCH_BATCH_FRAMES):
+            batch = frames[start:start + _PITCH_BATCH_FRAMES]
+            stop = start + batch.shape[0]
+            if method == "yin":
+                lags, cmndf, voiced = _yin_batch(batch, min_lag, max_lag, threshold)
+                pitches[start:stop] = np.where(voiced, sr / lags, 0.0)
+                confidence[start:stop] = np.clip(1.0 - cmndf, 0.0, 1.0)
+                continue
+
+            batch = batch - np.mean(batch, axis=1, keepdims=True)
+            if method == "improved_autocorr":
+                batch *= window
+            silent = np.all(np.abs(batch) <= 1e-8, axis=1)
+            corr = frame_autocorrelation(batch, max_lag=max_lag - 1)
+            lags = min_lag + np.argmax(corr[:, min_lag:max_lag], axis=1)
+            pitches[start:stop] = np.where(silent, 0.0, sr / lags)
+            peak = corr[np.arange(corr.shape[0]), lags]
+            normalized = np.divide(peak, corr[:, 0], out=np.zeros_like(peak), where=~silent)
+            confidence[start:stop] = np.clip(normalized, 0.0, 1.0)
+
+    if return_confidence:
+        return to_feature_matrix(pitches), to_feature_matrix(confidence)
     return to_feature_matrix(pitches)
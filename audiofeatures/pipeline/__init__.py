@@ -1,9 +1,17 @@
 """特征处理流水线子模块。"""
 
 from .feature_extraction import FeatureExtractor
-from .feature_aggregation import FeatureAggregator
+from .feature_aggregation import FeatureAggregator, StreamingAggregator
+from .feature_cache import FeatureCache
+from .feature_graph import FeaturePlan, build_plan
+from .spectral_context import SpectralContext
 
 __all__ = [
     "FeatureExtractor",
-    "FeatureAggregator"
+    "FeatureAggregator",
+    "StreamingAggregator",
+    "FeatureCache",
+    "FeaturePlan",
+    "build_plan",
+    "SpectralContext"
 ]
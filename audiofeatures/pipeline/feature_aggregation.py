@@ -1,7 +1,146 @@
 """特征聚合工具。"""
 
+from functools import cached_property
+
 import numpy as np
-from scipy import stats
+
+
+_AGGREGATION_METHODS = {
+    "mean",
+    "std",
+    "min",
+    "max",
+    "median",
+    "skewness",
+    "kurtosis",
+    "range"
+}
+
+
+def _quantile_level(method):
+    """解析 ``quantile_<百分位>`` 形式的聚合方法，非分位数方法返回 ``None``。"""
+    if not method.startswith("quantile_"):
+        return None
+    percent = method[len("quantile_"):]
+    if not percent.isdigit() or int(percent) > 100:
+        raise ValueError(f"Unsupported aggregation method: {method}")
+    return int(percent) / 100.0
+
+
+def _validate_methods(aggregation_methods):
+    for method in aggregation_methods:
+        if method not in _AGGREGATION_METHODS and _quantile_level(method) is None:
+            raise ValueError(f"Unsupported aggregation method: {method}")
+
+
+def _skewness(n, mean, m2, m3):
+    """由二、三阶中心矩计算无偏样本偏度，约定与 ``scipy.stats.skew(bias=False)`` 一致。"""
+    with np.errstate(all="ignore"):
+        zero = m2 <= (np.finfo(np.float64).eps * mean) ** 2
+        values = np.where(zero, np.nan, m3 / m2 ** 1.5)
+        if n > 2:
+            corrected = np.sqrt((n - 1.0) * n) / (n - 2.0) * m3 / m2 ** 1.5
+            values = np.where(zero, values, corrected)
+    return values
+
+
+def _kurtosis(n, mean, m2, m4):
+    """由二、四阶中心矩计算无偏超额峰度，约定与 ``scipy.stats.kurtosis(bias=False)`` 一致。"""
+    with np.errstate(all="ignore"):
+        zero = m2 <= (np.finfo(np.float64).eps * mean) ** 2
+        values = np.where(zero, np.nan, m4 / m2 ** 2.0)
+        if n > 3:
+            corrected = 1.0 / (n - 2) / (n - 3) * ((n ** 2 - 1.0) * m4 / m2 ** 2.0 - 3 * (n - 1) ** 2.0)
+            values = np.where(zero, values, corrected + 3.0)
+    return values - 3.0
+
+
+def _lerp(lower, upper, weight):
+    """与 ``np.quantile`` 相同的线性插值，保证端点处数值稳定。"""
+    diff = upper - lower
+    result = lower + diff * weight
+    return np.where(weight >= 0.5, upper - diff * (1.0 - weight), result)
+
+
+class _SummaryEngine:
+    """单个特征矩阵的统计量引擎。
+
+    均值、中心矩、排序结果等中间量按需计算一次，并在多个聚合方法之间共享：
+    偏度与峰度复用同一组离差幂次，中位数、分位数、最小值与最大值共享
+    同一次排序，``range`` 复用最小值与最大值。
+    """
+
+    def __init__(self, values):
+        """初始化引擎，``values`` 沿第 0 轴为帧。"""
+        self.values = np.asarray(values, dtype=np.float64)
+        self.n = self.values.shape[0]
+
+    @cached_property
+    def mean(self):
+        return np.mean(self.values, axis=0)
+
+    @cached_property
+    def _deviations(self):
+        return self.values - self.mean
+
+    @cached_property
+    def _squared(self):
+        return self._deviations ** 2
+
+    @cached_property
+    def m2(self):
+        return np.mean(self._squared, axis=0)
+
+    @cached_property
+    def m3(self):
+        return np.mean(self._squared * self._deviations, axis=0)
+
+    @cached_property
+    def m4(self):
+        return np.mean(self._squared ** 2, axis=0)
+
+    @cached_property
+    def sorted(self):
+        return np.sort(self.values, axis=0)
+
+    @cached_property
+    def min(self):
+        if "sorted" in self.__dict__:
+            return self.sorted[0]
+        return np.min(self.values, axis=0)
+
+    @cached_property
+    def max(self):
+        if "sorted" in self.__dict__:
+            return self.sorted[-1]
+        return np.max(self.values, axis=0)
+
+    def quantile(self, q):
+        position = q * (self.n - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, self.n - 1)
+        return _lerp(self.sorted[lower], self.sorted[upper], position - lower)
+
+    def compute(self, method):
+        if self.n == 0:
+            return np.full(self.values.shape[1:], np.nan)
+        if method == "mean":
+            return self.mean
+        if method == "std":
+            return np.sqrt(self.m2)
+        if method == "min":
+            return self.min
+        if method == "max":
+            return self.max
+        if method == "range":
+            return self.max - self.min
+        if method == "median":
+            return self.quantile(0.5)
+        if method == "skewness":
+            return _skewness(self.n, self.mean, self.m2, self.m3)
+        if method == "kurtosis":
+            return _kurtosis(self.n, self.mean, self.m2, self.m4)
+        return self.quantile(_quantile_level(method))
 
 
 class FeatureAggregator:
@@ -17,7 +156,8 @@ class FeatureAggregator:
             ``(n_frames, n_features)``。
         aggregation_methods : list or tuple
             聚合方法列表，支持 ``mean``、``std``、``min``、``max``、``median``、
-            ``skewness``、``kurtosis``、``range``、``quantile_25``、``quantile_75``。
+            ``skewness``、``kurtosis``、``range`` 以及 ``quantile_<百分位>``
+            （如 ``quantile_25``、``quantile_75``、``quantile_90``）。
 
         Returns
         -------
@@ -28,61 +168,31 @@ class FeatureAggregator:
         ------
         ValueError
             输入非法或聚合方法不支持时抛出。
+
+        Notes
+        -----
+        每个特征只做一次统计扫描：前四阶中心矩共享同一组离差，
+        中位数、分位数与最小/最大值共享同一次排序。计算以 ``float64``
+        进行，结果为 ``float32``。零帧特征的各统计量为 ``nan``。
         """
         if not isinstance(features, dict):
             raise ValueError("features must be a dict")
         if not isinstance(aggregation_methods, (list, tuple)):
             raise ValueError("aggregation_methods must be a list or tuple")
+        _validate_methods(aggregation_methods)
 
         aggregated = {}
         for name, values in features.items():
             arr = np.asarray(values)
-            if arr.ndim == 1:
-                axis = 0
-            elif arr.ndim == 2:
-                axis = 0
-            else:
+            if arr.ndim not in (1, 2):
                 raise ValueError("feature arrays must be 1D or 2D")
 
+            engine = _SummaryEngine(arr)
             for method in aggregation_methods:
-                key = f"{name}_{method}"
-                if method == "mean":
-                    aggregated[key] = np.asarray(np.mean(arr, axis=axis), dtype=np.float32)
-                elif method == "std":
-                    aggregated[key] = np.asarray(np.std(arr, axis=axis), dtype=np.float32)
-                elif method == "min":
-                    aggregated[key] = np.asarray(np.min(arr, axis=axis), dtype=np.float32)
-                elif method == "max":
-                    aggregated[key] = np.asarray(np.max(arr, axis=axis), dtype=np.float32)
-                elif method == "median":
-                    aggregated[key] = np.asarray(np.median(arr, axis=axis), dtype=np.float32)
-                elif method == "skewness":
-                    aggregated[key] = np.asarray(
-                        stats.skew(arr, axis=axis, bias=False),
-                        dtype=np.float32
-                    )
-                elif method == "kurtosis":
-                    aggregated[key] = np.asarray(
-                        stats.kurtosis(arr, axis=axis, bias=False),
-                        dtype=np.float32
-                    )
-                elif method == "range":
-                    aggregated[key] = np.asarray(
-                        np.max(arr, axis=axis) - np.min(arr, axis=axis),
-                        dtype=np.float32
-                    )
-                elif method == "quantile_25":
-                    aggregated[key] = np.asarray(
-                        np.quantile(arr, 0.25, axis=axis),
-                        dtype=np.float32
-                    )
-                elif method == "quantile_75":
-                    aggregated[key] = np.asarray(
-                        np.quantile(arr, 0.75, axis=axis),
-                        dtype=np.float32
-                    )
-                else:
-                    raise ValueError(f"Unsupported aggregation method: {method}")
+                aggregated[f"{name}_{method}"] = np.asarray(
+                    engine.compute(method),
+                    dtype=np.float32
+                )
 
         return aggregated
 
@@ -108,3 +218,271 @@ class FeatureAggregator:
             feature_name, stat = key.rsplit("_", 1)
             grouped.setdefault(feature_name, {})[stat] = value
         return grouped
+
+
+class _QuantileSketch:
+    """可合并的近似分位数草图（多层压缩器，按列独立排序）。
+
+    第 ``h`` 层中的每个样本代表 ``2 ** h`` 个原始值。某层样本数超过
+    ``capacity`` 时按列排序并隔一取一，提升到上一层；由于同层样本权重相同，
+    压缩可在所有特征维度上向量化完成。未发生压缩时分位数结果是精确的。
+    """
+
+    def __init__(self, n_features, capacity):
+        self.n_features = n_features
+        self.capacity = capacity
+        self.levels = []
+        self._parity = []
+
+    def update(self, values):
+        self._insert(0, values)
+
+    def merge(self, other):
+        for level, items in enumerate(other.levels):
+            self._insert(level, items)
+
+    def _insert(self, level, items):
+        while len(self.levels) <= level:
+            self.levels.append(np.empty((0, self.n_features)))
+            self._parity.append(0)
+        self.levels[level] = np.concatenate((self.levels[level], items))
+        if self.levels[level].shape[0] <= self.capacity:
+            return
+        items = np.sort(self.levels[level], axis=0)
+        even = items.shape[0] - items.shape[0] % 2
+        offset = self._parity[level]
+        self._parity[level] ^= 1
+        self.levels[level] = items[even:]
+        self._insert(level + 1, items[offset:even:2])
+
+    def quantile(self, q, minimum, maximum):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(level.shape[0], 2.0 ** h) for h, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, axis=0)
+        items = np.take_along_axis(items, order, axis=0)
+        weights = weights[order]
+        cumulative = np.cumsum(weights, axis=0)
+        centers = cumulative - (weights + 1.0) / 2.0
+        target = q * (cumulative[-1] - 1.0)
+        result = np.array([
+            np.interp(target[col], centers[:, col], items[:, col])
+            for col in range(self.n_features)
+        ])
+        return np.clip(result, minimum, maximum)
+
+
+class _StreamingState:
+    """单个特征的可合并统计状态。
+
+    ``m2``、``m3``、``m4`` 为中心矩的累加和（未除以样本数），
+    按 Chan 等人的并行公式合并。
+    """
+
+    def __init__(self, n_features, ndim, sketch_size):
+        self.ndim = ndim
+        self.n = 0
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+        self.m3 = np.zeros(n_features)
+        self.m4 = np.zeros(n_features)
+        self.min = np.full(n_features, np.inf)
+        self.max = np.full(n_features, -np.inf)
+        self.sketch = _QuantileSketch(n_features, sketch_size)
+
+    def update(self, values):
+        n = values.shape[0]
+        if n == 0:
+            return
+        mean = np.mean(values, axis=0)
+        deviations = values - mean
+        squared = deviations ** 2
+        chunk = (
+            n,
+            mean,
+            np.sum(squared, axis=0),
+            np.sum(squared * deviations, axis=0),
+            np.sum(squared ** 2, axis=0)
+        )
+        self._combine(*chunk)
+        np.minimum(self.min, np.min(values, axis=0), out=self.min)
+        np.maximum(self.max, np.max(values, axis=0), out=self.max)
+        self.sketch.update(values)
+
+    def merge(self, other):
+        if other.n == 0:
+            return
+        self._combine(other.n, other.mean, other.m2, other.m3, other.m4)
+        np.minimum(self.min, other.min, out=self.min)
+        np.maximum(self.max, other.max, out=self.max)
+        self.sketch.merge(other.sketch)
+
+    def _combine(self, n_b, mean_b, m2_b, m3_b, m4_b):
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        delta_n = delta / n
+        m2_a, m3_a = self.m2, self.m3
+        self.m4 = (
+            self.m4 + m4_b
+            + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6.0 * delta_n ** 2 * (n_a * n_a * m2_b + n_b * n_b * m2_a)
+            + 4.0 * delta_n * (n_a * m3_b - n_b * m3_a)
+        )
+        self.m3 = (
+            m3_a + m3_b
+            + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+            + 3.0 * delta_n * (n_a * m2_b - n_b * m2_a)
+        )
+        self.m2 = m2_a + m2_b + delta * delta_n * n_a * n_b
+        self.mean = self.mean + delta_n * n_b
+        self.n = n
+
+    def compute(self, method):
+        if self.n == 0:
+            return np.full(self.mean.shape, np.nan)
+        if method == "mean":
+            return self.mean
+        if method == "std":
+            return np.sqrt(self.m2 / self.n)
+        if method == "min":
+            return self.min
+        if method == "max":
+            return self.max
+        if method == "range":
+            return self.max - self.min
+        if method == "skewness":
+            return _skewness(self.n, self.mean, self.m2 / self.n, self.m3 / self.n)
+        if method == "kurtosis":
+            return _kurtosis(self.n, self.mean, self.m2 / self.n, self.m4 / self.n)
+        q = 0.5 if method == "median" else _quantile_level(method)
+        return self.sketch.quantile(q, self.min, self.max)
+
+
+class StreamingAggregator:
+    """可增量更新、可合并的特征聚合器。
+
+    与 :class:`FeatureAggregator` 使用相同的聚合方法与输出键，但无需
+    一次性持有完整的 ``(n_frames, n_features)`` 矩阵：适合聚合流式提取的
+    特征块，或合并多个工作进程的部分结果。
+
+    Parameters
+    ----------
+    sketch_size : int, optional
+        分位数草图每层保留的样本数。越大越精确，内存约为
+        ``sketch_size * n_features * log2(n_frames / sketch_size)``。
+
+    Notes
+    -----
+    ``mean``、``std``、``skewness``、``kurtosis``、``min``、``max``、``range``
+    为精确值（中心矩按 Welford/Chan 公式合并）；``median`` 与
+    ``quantile_<百分位>`` 在帧数不超过 ``sketch_size`` 时精确，否则为近似值，
+    秩误差随 ``sketch_size`` 增大而减小。
+
+    Examples
+    --------
+    >>> aggregator = StreamingAggregator()
+    >>> for chunk in extractor.extract_stream("long.wav", ["mfcc"]):
+    ...     aggregator.update(chunk)
+    >>> summary = aggregator.finalize(["mean", "std", "median"])
+    """
+
+    def __init__(self, sketch_size=512):
+        """初始化流式聚合器。"""
+        if sketch_size < 2:
+            raise ValueError("sketch_size must be >= 2")
+        self.sketch_size = sketch_size
+        self._states = {}
+
+    def update(self, features):
+        """累加一块帧级特征。
+
+        Parameters
+        ----------
+        features : dict
+            特征字典，值为 ``(n_frames, n_features)`` 或一维数组。
+            同名特征在各块之间的特征维度必须一致。
+
+        Returns
+        -------
+        StreamingAggregator
+            返回自身，便于链式调用。
+
+        Raises
+        ------
+        ValueError
+            输入非法或特征维度不一致时抛出。
+        """
+        if not isinstance(features, dict):
+            raise ValueError("features must be a dict")
+        for name, values in features.items():
+            arr = np.asarray(values, dtype=np.float64)
+            if arr.ndim not in (1, 2):
+                raise ValueError("feature arrays must be 1D or 2D")
+            state = self._state(name, arr.shape[1] if arr.ndim == 2 else 1, arr.ndim)
+            state.update(arr.reshape(arr.shape[0], -1))
+        return self
+
+    def merge(self, other):
+        """将另一个聚合器的状态合并到当前聚合器。
+
+        Parameters
+        ----------
+        other : StreamingAggregator
+            待合并的聚合器，其状态不会被修改。
+
+        Returns
+        -------
+        StreamingAggregator
+            返回自身。
+
+        Raises
+        ------
+        ValueError
+            类型不符或同名特征维度不一致时抛出。
+        """
+        if not isinstance(other, StreamingAggregator):
+            raise ValueError("other must be a StreamingAggregator")
+        for name, other_state in other._states.items():
+            state = self._state(name, other_state.mean.shape[0], other_state.ndim)
+            state.merge(other_state)
+        return self
+
+    def finalize(self, aggregation_methods):
+        """计算聚合结果。
+
+        Parameters
+        ----------
+        aggregation_methods : list or tuple
+            聚合方法列表，与 :meth:`FeatureAggregator.aggregate_features` 相同。
+
+        Returns
+        -------
+        dict
+            聚合后的特征字典，键为 ``{name}_{method}``，值为 ``float32`` 数组。
+
+        Raises
+        ------
+        ValueError
+            聚合方法不支持时抛出。
+        """
+        if not isinstance(aggregation_methods, (list, tuple)):
+            raise ValueError("aggregation_methods must be a list or tuple")
+        _validate_methods(aggregation_methods)
+
+        aggregated = {}
+        for name, state in self._states.items():
+            for method in aggregation_methods:
+                value = np.asarray(state.compute(method), dtype=np.float32)
+                aggregated[f"{name}_{method}"] = value[0] if state.ndim == 1 else value
+        return aggregated
+
+    def _state(self, name, n_features, ndim):
+        state = self._states.get(name)
+        if state is None:
+            state = _StreamingState(n_features, ndim, self.sketch_size)
+            self._states[name] = state
+        elif state.mean.shape[0] != n_features or state.ndim != ndim:
+            raise ValueError(f"inconsistent feature shape for '{name}'")
+        return state
@@ -0,0 +1,125 @@
+"""按内容寻址的持久化特征缓存。"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from audiofeatures.core.audio_cache import _atomic_write
+
+_FINGERPRINT_CHUNK = 1 << 20
+
+
+class FeatureCache:
+    """以音频内容指纹与提取配置为键的磁盘特征缓存。
+
+    每个特征单独存为未压缩的 ``.npy`` 文件，命中时以内存映射方式读回，
+    因此只新增一种特征类型的实验只需计算该特征。
+
+    Parameters
+    ----------
+    cache_dir : str
+        缓存目录，不存在时自动创建。
+
+    Attributes
+    ----------
+    hits : int
+        命中的特征数。
+    misses : int
+        未命中的特征数。
+
+    Notes
+    -----
+    - 音频指纹为文件内容的 BLAKE2b 摘要，与路径无关；同一进程内按
+      ``(路径, mtime_ns, 文件大小)`` 记忆，避免重复读取文件。
+    - 键中包含 ``sr``、``n_fft``、``hop_length``、``n_mels``、``n_mfcc``、
+      特征名称与 ``audiofeatures.__version__``，任一变化都会重新计算。
+    - 写入先写临时文件再原子替换，可被多个进程共享。
+
+    Examples
+    --------
+    >>> extractor = FeatureExtractor(sr=16000, feature_cache=FeatureCache(".features"))
+    >>> features = extractor.extract_from_file("a.wav", ["mfcc", "rms"])
+    """
+
+    def __init__(self, cache_dir):
+        """初始化特征缓存。"""
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._fingerprints = {}
+
+    def fingerprint(self, file_path):
+        """计算音频文件的内容指纹。
+
+        Parameters
+        ----------
+        file_path : str
+            音频文件路径。
+
+        Returns
+        -------
+        str
+            十六进制摘要。
+        """
+        path = os.path.abspath(os.fspath(file_path))
+        stat = os.stat(path)
+        identity = (path, stat.st_mtime_ns, stat.st_size)
+        digest = self._fingerprints.get(identity)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=20)
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(_FINGERPRINT_CHUNK), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._fingerprints[identity] = digest
+        return digest
+
+    def key(self, fingerprint, extractor, feature_type):
+        """由音频指纹、提取配置与特征名称生成缓存键。"""
+        from audiofeatures import __version__
+
+        config = {
+            "audio": fingerprint,
+            "feature": feature_type,
+            "sr": extractor.sr,
+            "n_fft": extractor.n_fft,
+            "hop_length": extractor.hop_length,
+            "n_mels": extractor.n_mels,
+            "n_mfcc": extractor.n_mfcc,
+            "version": __version__
+        }
+        payload = json.dumps(config, sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+    def get(self, key):
+        """读取缓存特征，未命中时返回 ``None``。
+
+        Returns
+        -------
+        ndarray or None
+            以只读内存映射方式打开的 ``(n_frames, n_features)`` 数组。
+        """
+        try:
+            values = np.load(self._path(key), mmap_mode="r")
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return values
+
+    def put(self, key, values):
+        """写入特征。"""
+        values = np.ascontiguousarray(values, dtype=np.float32)
+        _atomic_write(self._path(key), lambda f: np.save(f, values))
+
+    def __getstate__(self):
+        return {"cache_dir": self.cache_dir}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".npy")
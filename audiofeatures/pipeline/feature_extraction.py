@@ -1,16 +1,93 @@
 """特征提取流水线。"""
 
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice
+
 import librosa
+import numpy as np
 
-from audiofeatures.core.audio_loader import load_audio
-from audiofeatures.features.frequency_domain import (
-    spectral_bandwidth,
-    spectral_centroid,
-    spectral_rolloff
-)
-from audiofeatures.features.spectral import mfcc
+from audiofeatures.core.audio_loader import iter_audio_blocks, load_audio
 from audiofeatures.features.time_domain import zero_crossing_rate
-from audiofeatures.utils.contract import ensure_float32, to_feature_matrix
+from audiofeatures.pipeline.feature_graph import build_plan, execute_plan
+from audiofeatures.pipeline.spectral_context import SpectralContext
+from audiofeatures.utils.contract import ensure_float32
+
+
+STREAMING_FEATURES = (
+    "mfcc",
+    "spectral_centroid",
+    "spectral_bandwidth",
+    "spectral_rolloff",
+    "zcr",
+    "rms"
+)
+
+
+def _count_frames(length, frame_length, hop_length):
+    if length < frame_length:
+        return 0
+    return (length - frame_length) // hop_length + 1
+
+
+def _iter_stream_segments(blocks, frame_length, hop_length):
+    """将音频块切分为可整帧计算的片段。
+
+    以 ``center=True`` 的方式在流首尾各补 ``frame_length // 2`` 个零，
+    每个片段只包含新的完整帧，相邻片段之间保留 ``frame_length - hop_length``
+    个样本的重叠。
+
+    Yields
+    ------
+    tuple
+        ``(centered, raw)``。``centered`` 为补零流上的片段，按
+        ``center=False`` 分帧即得到与整段 ``center=True`` 分帧一致的新帧；
+        ``raw`` 为未补零原始信号上的片段，用于 ``center=False`` 的帧级特征。
+    """
+    pad = frame_length // 2
+    buffer = np.zeros(pad, dtype=np.float32)
+    buffer_start = 0
+    centered_pos = 0
+    raw_pos = pad
+    blocks = ((block, False) for block in blocks)
+    tail = [(np.zeros(0, dtype=np.float32), True)]
+
+    for block, last in chain(blocks, tail):
+        buffer = np.concatenate((buffer, block))
+        raw_end = buffer_start + buffer.shape[0]
+        if last:
+            buffer = np.concatenate((buffer, np.zeros(pad, dtype=np.float32)))
+        buffer_end = buffer_start + buffer.shape[0]
+
+        n_centered = _count_frames(buffer_end - centered_pos, frame_length, hop_length)
+        n_raw = _count_frames(raw_end - raw_pos, frame_length, hop_length)
+        centered = buffer[
+            centered_pos - buffer_start:
+            centered_pos - buffer_start + (n_centered - 1) * hop_length + frame_length
+        ] if n_centered else buffer[:0]
+        raw = buffer[
+            raw_pos - buffer_start:
+            raw_pos - buffer_start + (n_raw - 1) * hop_length + frame_length
+        ] if n_raw else buffer[:0]
+        centered_pos += n_centered * hop_length
+        raw_pos += n_raw * hop_length
+        yield centered, raw
+
+        keep = min(centered_pos, raw_pos)
+        buffer = buffer[keep - buffer_start:]
+        buffer_start = keep
+
+
+def _extract_chunk(extractor, paths, feature_types):
+    """在工作进程中逐个提取文件特征，单个文件失败不影响其余文件。"""
+    results = []
+    for path in paths:
+        try:
+            results.append((path, extractor.extract_from_file(path, feature_types)))
+        except Exception as e:
+            results.append((path, e))
+    return results
 
 
 class FeatureExtractor:
@@ -28,6 +105,10 @@ class FeatureExtractor:
         Mel 滤波器组数量。
     n_mfcc : int, optional
         MFCC 系数数量。
+    audio_cache : AudioCache or None, optional
+        :meth:`extract_from_file` 读取音频时使用的解码缓存。
+    feature_cache : FeatureCache or None, optional
+        :meth:`extract_from_file` 使用的持久化特征缓存，只计算未缓存的特征。
 
     Attributes
     ----------
@@ -41,15 +122,30 @@ class FeatureExtractor:
         Mel 滤波器组数量。
     n_mfcc : int
         MFCC 系数数量。
+    audio_cache : AudioCache or None
+        解码缓存。
+    feature_cache : FeatureCache or None
+        特征缓存。
     """
 
-    def __init__(self, sr=22050, n_fft=2048, hop_length=512, n_mels=128, n_mfcc=13):
+    def __init__(
+        self,
+        sr=22050,
+        n_fft=2048,
+        hop_length=512,
+        n_mels=128,
+        n_mfcc=13,
+        audio_cache=None,
+        feature_cache=None
+    ):
         """初始化特征提取器。"""
         self.sr = sr
         self.n_fft = n_fft
         self.hop_length = hop_length
         self.n_mels = n_mels
         self.n_mfcc = n_mfcc
+        self.audio_cache = audio_cache
+        self.feature_cache = feature_cache
 
     def extract_features(self, signal, feature_types):
         """从信号中提取指定特征。
@@ -73,86 +169,53 @@ class FeatureExtractor:
         ------
         ValueError
             输入非法或特征名称不支持时抛出。
+
+        Notes
+        -----
+        特征按 :meth:`plan` 给出的依赖图执行，同一次调用中的特征共享一个
+        :class:`SpectralContext`，STFT、功率谱、Mel 频谱等中间量各只计算一次。
+        ``tempogram`` 的起点包络与 ``tonnetz`` 的谐波分量同样复用共享 STFT，
+        因此遵循提取器的 ``n_fft``、``hop_length`` 与 ``n_mels`` 配置。
         """
         signal = ensure_float32(signal)
         if signal.ndim != 1:
             raise ValueError("signal must be a 1D array")
-        if not isinstance(feature_types, (list, tuple)):
-            raise ValueError("feature_types must be a list or tuple")
-
-        features = {}
-        for feature_type in feature_types:
-            if feature_type == "mfcc":
-                features[feature_type] = mfcc(
-                    signal,
-                    sr=self.sr,
-                    n_mfcc=self.n_mfcc,
-                    n_fft=self.n_fft,
-                    hop_length=self.hop_length,
-                    n_mels=self.n_mels
-                )
-            elif feature_type == "spectral_centroid":
-                features[feature_type] = spectral_centroid(
-                    signal,
-                    sr=self.sr,
-                    n_fft=self.n_fft,
-                    hop_length=self.hop_length
-                )
-            elif feature_type == "spectral_bandwidth":
-                features[feature_type] = spectral_bandwidth(
-                    signal,
-                    sr=self.sr,
-                    n_fft=self.n_fft,
-                    hop_length=self.hop_length
-                )
-            elif feature_type == "spectral_rolloff":
-                features[feature_type] = spectral_rolloff(
-                    signal,
-                    sr=self.sr,
-                    n_fft=self.n_fft,
-                    hop_length=self.hop_length
-                )
-            elif feature_type == "zcr":
-                features[feature_type] = zero_crossing_rate(
-                    signal,
-                    frame_length=self.n_fft,
-                    hop_length=self.hop_length
-                )
-            elif feature_type == "rms":
-                rms = librosa.feature.rms(
-                    y=signal,
-                    frame_length=self.n_fft,
-                    hop_length=self.hop_length
-                )
-                features[feature_type] = to_feature_matrix(rms, frame_axis=1)
-            elif feature_type == "chroma":
-                chroma = librosa.feature.chroma_stft(
-                    y=signal,
-                    sr=self.sr,
-                    n_fft=self.n_fft,
-                    hop_length=self.hop_length
-                )
-                features[feature_type] = to_feature_matrix(chroma, frame_axis=1)
-            elif feature_type == "tonnetz":
-                harmonic = librosa.effects.harmonic(signal)
-                tonnetz = librosa.feature.tonnetz(y=harmonic, sr=self.sr)
-                features[feature_type] = to_feature_matrix(tonnetz, frame_axis=1)
-            elif feature_type == "tempogram":
-                onset_env = librosa.onset.onset_strength(
-                    y=signal,
-                    sr=self.sr,
-                    hop_length=self.hop_length
-                )
-                tempogram = librosa.feature.tempogram(
-                    onset_envelope=onset_env,
-                    sr=self.sr,
-                    hop_length=self.hop_length
-                )
-                features[feature_type] = to_feature_matrix(tempogram, frame_axis=1)
-            else:
-                raise ValueError(f"Unsupported feature type: {feature_type}")
 
-        return features
+        plan = build_plan(feature_types)
+        context = SpectralContext(
+            signal,
+            sr=self.sr,
+            n_fft=self.n_fft,
+            hop_length=self.hop_length,
+            n_mels=self.n_mels
+        )
+        return execute_plan(plan, context, self)
+
+    def plan(self, feature_types):
+        """返回特征列表的执行计划而不实际计算。
+
+        Parameters
+        ----------
+        feature_types : list or tuple
+            特征名称列表。
+
+        Returns
+        -------
+        FeaturePlan
+            执行计划，``intermediates`` 为按依赖顺序排列的中间量，
+            ``features`` 为去重后的特征名称。
+
+        Raises
+        ------
+        ValueError
+            输入非法或特征名称不支持时抛出。
+
+        Examples
+        --------
+        >>> FeatureExtractor().plan(["mfcc", "chroma"])
+        FeaturePlan(intermediates=['stft', 'magnitude', 'power', 'mel', 'log_mel'], features=['mfcc', 'chroma'])
+        """
+        return build_plan(feature_types)
 
     def extract_from_file(self, file_path, feature_types):
         """从音频文件中提取指定特征。
@@ -167,10 +230,195 @@ class FeatureExtractor:
         Returns
         -------
         dict
-            特征字典。
+            特征字典。设置了 ``feature_cache`` 时，命中的特征为只读内存映射数组。
         """
-        signal, _ = load_audio(file_path, sr=self.sr, mono=True)
-        return self.extract_features(signal, feature_types)
+        if self.feature_cache is None:
+            signal, _ = load_audio(file_path, sr=self.sr, mono=True, cache=self.audio_cache)
+            return self.extract_features(signal, feature_types)
+
+        plan = build_plan(feature_types)
+        cache = self.feature_cache
+        fingerprint = cache.fingerprint(file_path)
+        keys = {name: cache.key(fingerprint, self, name) for name in plan.features}
+        features = {name: cache.get(key) for name, key in keys.items()}
+        missing = [name for name, values in features.items() if values is None]
+        if missing:
+            signal, _ = load_audio(file_path, sr=self.sr, mono=True, cache=self.audio_cache)
+            computed = self.extract_features(signal, missing)
+            for name, values in computed.items():
+                cache.put(keys[name], values)
+            features.update(computed)
+        return features
+
+    def extract_from_files(self, paths, feature_types, n_workers=None, chunksize=1):
+        """使用进程池从多个音频文件中批量提取特征。
+
+        Parameters
+        ----------
+        paths : iterable of str
+            音频文件路径，可为任意可迭代对象（按需消费）。
+        feature_types : list or tuple
+            特征名称列表。
+        n_workers : int or None, optional
+            工作进程数，默认 ``os.cpu_count()``。为 1 时在当前进程中顺序执行。
+        chunksize : int, optional
+            每个任务包含的文件数。文件较短时增大该值可降低进程间通信开销。
+
+        Returns
+        -------
+        iterator of tuple
+            按完成顺序产出 ``(path, features)``。提取成功时 ``features`` 为特征
+            字典；失败时为捕获到的异常对象，批处理不会因此中断。
+
+        Raises
+        ------
+        ValueError
+            参数非法或特征名称不支持时在调用时立即抛出。
+
+        Notes
+        -----
+        - 同时在途的任务数限制为 ``2 * n_workers``，内存占用与文件总数无关。
+        - 任务结果无法回传（如异常不可序列化）或工作进程崩溃时，该任务中的
+          每个文件都以对应异常产出；进程池损坏后自动新建进程池继续处理剩余文件。
+
+        Examples
+        --------
+        >>> extractor = FeatureExtractor(sr=16000)
+        >>> for path, features in extractor.extract_from_files(paths, ["mfcc"]):
+        ...     if isinstance(features, Exception):
+        ...         continue
+        """
+        build_plan(feature_types)
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers <= 0:
+            raise ValueError("n_workers must be > 0")
+        if chunksize <= 0:
+            raise ValueError("chunksize must be > 0")
+        return self._iter_extract_files(paths, feature_types, n_workers, chunksize)
+
+    def _iter_extract_files(self, paths, feature_types, n_workers, chunksize):
+        paths = iter(paths)
+        chunks = iter(lambda: list(islice(paths, chunksize)), [])
+        if n_workers == 1:
+            for chunk in chunks:
+                yield from _extract_chunk(self, chunk, feature_types)
+            return
+
+        broken = True
+        while broken:
+            broken = False
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                pending = {
+                    executor.submit(_extract_chunk, self, chunk, feature_types): chunk
+                    for chunk in islice(chunks, 2 * n_workers)
+                }
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk = pending.pop(future)
+                        try:
+                            results = future.result()
+                        except BrokenProcessPool as e:
+                            broken = True
+                            results = [(path, e) for path in chunk]
+                        except Exception as e:
+                            results = [(path, e) for path in chunk]
+                        if not broken:
+                            for next_chunk in islice(chunks, 1):
+                                try:
+                                    future = executor.submit(_extract_chunk, self, next_chunk, feature_types)
+                                except BrokenProcessPool:
+                                    # 进程池已损坏，该任务留给新进程池
+                                    broken = True
+                                    chunks = chain([next_chunk], chunks)
+                                else:
+                                    pending[future] = next_chunk
+                        yield from results
+
+    def extract_stream(self, file_path, feature_types, block_size=262144):
+        """以有界内存流式提取长录音的帧级特征。
+
+        Parameters
+        ----------
+        file_path : str
+            音频文件路径，需为 ``soundfile`` 可读格式。采样率与 ``self.sr`` 不同时
+            按块流式重采样。
+        feature_types : list or tuple
+            特征名称列表，支持 ``mfcc``、``spectral_centroid``、
+            ``spectral_bandwidth``、``spectral_rolloff``、``zcr``、``rms``。
+        block_size : int, optional
+            每次读取的样本数。峰值内存与该值成正比，与录音时长无关。
+
+        Yields
+        ------
+        dict
+            特征块字典，值为 ``(n_new_frames, n_features)`` 的 ``float32`` 数组。
+            各块沿帧轴拼接后与 :meth:`extract_from_file` 的结果一致（``mfcc``
+            的 Mel 投影由 BLAS 按块宽选择内核，可能存在 float32 舍入级差异）。
+            ``zcr`` 不补零分帧，其每块帧数可能与其他特征不同。
+
+        Raises
+        ------
+        ValueError
+            参数非法或特征不支持流式计算时抛出。
+
+        Notes
+        -----
+        ``mfcc`` 的对数 Mel 频谱按全局峰值截断 80 dB 动态范围，因此请求 ``mfcc``
+        时会先流式扫描一遍文件求得该峰值，计算量约增加一倍，内存仍保持有界。
+        """
+        plan = build_plan(feature_types)
+        unsupported = [name for name in plan.features if name not in STREAMING_FEATURES]
+        if unsupported:
+            raise ValueError(f"Features do not support streaming: {unsupported}")
+        if block_size <= 0:
+            raise ValueError("block_size must be > 0")
+
+        def segments():
+            return _iter_stream_segments(
+                iter_audio_blocks(file_path, block_size, sr=self.sr, mono=True),
+                frame_length=self.n_fft,
+                hop_length=self.hop_length
+            )
+
+        def context(centered, log_mel_peak=None):
+            return SpectralContext(
+                centered,
+                sr=self.sr,
+                n_fft=self.n_fft,
+                hop_length=self.hop_length,
+                n_mels=self.n_mels,
+                center=False,
+                log_mel_peak=log_mel_peak
+            )
+
+        log_mel_peak = None
+        if "mfcc" in plan.features:
+            for centered, _ in segments():
+                if centered.size:
+                    peak = librosa.power_to_db(context(centered).mel, top_db=None).max()
+                    log_mel_peak = peak if log_mel_peak is None else max(log_mel_peak, peak)
+
+        spectral_plan = build_plan([name for name in plan.features if name != "zcr"])
+        for centered, raw in segments():
+            if centered.size:
+                chunk = execute_plan(spectral_plan, context(centered, log_mel_peak), self)
+            else:
+                chunk = {
+                    name: np.zeros((0, self.n_mfcc if name == "mfcc" else 1), dtype=np.float32)
+                    for name in spectral_plan.features
+                }
+            if "zcr" in plan.features:
+                if raw.size:
+                    chunk["zcr"] = zero_crossing_rate(
+                        raw,
+                        frame_length=self.n_fft,
+                        hop_length=self.hop_length
+                    )
+                else:
+                    chunk["zcr"] = np.zeros((0, 1), dtype=np.float32)
+            yield {name: chunk[name] for name in plan.features}
 
     def extract_all_features(self, signal):
         """提取全部支持的特征类型。
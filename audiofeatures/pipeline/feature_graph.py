@@ -0,0 +1,242 @@
+"""特征依赖图与执行计划。
+
+每个特征声明其依赖的谱中间量（STFT、功率谱、Mel 频谱、起点包络、
+谐波分量等），规划器据此为请求的特征列表生成最小执行计划，
+保证每个中间量只计算一次。中间量本身由 :class:`SpectralContext`
+按需计算并缓存。
+"""
+
+from collections import namedtuple
+
+import librosa
+
+from audiofeatures.features.time_domain import zero_crossing_rate
+from audiofeatures.utils.contract import to_feature_matrix
+
+
+FeatureNode = namedtuple("FeatureNode", ["name", "inputs", "compute"])
+FeatureNode.__doc__ = """依赖图中的节点。
+
+Attributes
+----------
+name : str
+    节点名称。
+inputs : tuple of str
+    依赖的中间量名称。
+compute : callable or None
+    特征节点的计算函数，签名为 ``compute(context, extractor)``；
+    中间量节点为 ``None``，其值由 :class:`SpectralContext` 的同名属性提供。
+"""
+
+
+def _mfcc(context, extractor):
+    mfccs = librosa.feature.mfcc(S=context.log_mel, n_mfcc=extractor.n_mfcc)
+    return to_feature_matrix(mfccs, frame_axis=1)
+
+
+def _spectral_centroid(context, extractor):
+    centroid = librosa.feature.spectral_centroid(
+        S=context.magnitude,
+        sr=context.sr,
+        n_fft=context.n_fft
+    )
+    return to_feature_matrix(centroid, frame_axis=1)
+
+
+def _spectral_bandwidth(context, extractor):
+    bandwidth = librosa.feature.spectral_bandwidth(
+        S=context.magnitude,
+        sr=context.sr,
+        n_fft=context.n_fft
+    )
+    return to_feature_matrix(bandwidth, frame_axis=1)
+
+
+def _spectral_rolloff(context, extractor):
+    rolloff = librosa.feature.spectral_rolloff(
+        S=context.magnitude,
+        sr=context.sr,
+        n_fft=context.n_fft
+    )
+    return to_feature_matrix(rolloff, frame_axis=1)
+
+
+def _zcr(context, extractor):
+    return zero_crossing_rate(
+        context.signal,
+        frame_length=context.n_fft,
+        hop_length=context.hop_length
+    )
+
+
+def _rms(context, extractor):
+    rms = librosa.feature.rms(
+        y=context.signal,
+        frame_length=context.n_fft,
+        hop_length=context.hop_length,
+        center=context.center,
+        pad_mode=context.pad_mode
+    )
+    return to_feature_matrix(rms, frame_axis=1)
+
+
+def _chroma(context, extractor):
+    chroma = librosa.feature.chroma_stft(
+        S=context.power,
+        sr=context.sr,
+        n_fft=context.n_fft,
+        hop_length=context.hop_length
+    )
+    return to_feature_matrix(chroma, frame_axis=1)
+
+
+def _tonnetz(context, extractor):
+    tonnetz = librosa.feature.tonnetz(y=context.harmonic, sr=context.sr)
+    return to_feature_matrix(tonnetz, frame_axis=1)
+
+
+def _tempogram(context, extractor):
+    tempogram = librosa.feature.tempogram(
+        onset_envelope=context.onset_envelope,
+        sr=context.sr,
+        hop_length=context.hop_length
+    )
+    return to_feature_matrix(tempogram, frame_axis=1)
+
+
+INTERMEDIATES = {
+    node.name: node
+    for node in (
+        FeatureNode("stft", (), None),
+        FeatureNode("magnitude", ("stft",), None),
+        FeatureNode("power", ("magnitude",), None),
+        FeatureNode("mel", ("power",), None),
+        FeatureNode("log_mel", ("mel",), None),
+        FeatureNode("onset_envelope", ("log_mel",), None),
+        FeatureNode("harmonic", ("stft",), None)
+    )
+}
+
+FEATURES = {
+    node.name: node
+    for node in (
+        FeatureNode("mfcc", ("log_mel",), _mfcc),
+        FeatureNode("spectral_centroid", ("magnitude",), _spectral_centroid),
+        FeatureNode("spectral_bandwidth", ("magnitude",), _spectral_bandwidth),
+        FeatureNode("spectral_rolloff", ("magnitude",), _spectral_rolloff),
+        FeatureNode("zcr", (), _zcr),
+        FeatureNode("rms", (), _rms),
+        FeatureNode("chroma", ("power",), _chroma),
+        FeatureNode("tonnetz", ("harmonic",), _tonnetz),
+        FeatureNode("tempogram", ("onset_envelope",), _tempogram)
+    )
+}
+
+
+class FeaturePlan:
+    """特征列表的执行计划。
+
+    Attributes
+    ----------
+    intermediates : tuple of str
+        需要计算的中间量，按拓扑顺序排列。
+    features : tuple of str
+        需要计算的特征，保持请求顺序且去重。
+    """
+
+    def __init__(self, intermediates, features):
+        """初始化执行计划。"""
+        self.intermediates = tuple(intermediates)
+        self.features = tuple(features)
+
+    @property
+    def steps(self):
+        """按执行顺序排列的全部节点名称。"""
+        return self.intermediates + self.features
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __eq__(self, other):
+        if not isinstance(other, FeaturePlan):
+            return NotImplemented
+        return self.steps == other.steps
+
+    def __repr__(self):
+        return (
+            f"FeaturePlan(intermediates={list(self.intermediates)}, "
+            f"features={list(self.features)})"
+        )
+
+
+def build_plan(feature_types):
+    """为特征列表构建最小执行计划。
+
+    Parameters
+    ----------
+    feature_types : list or tuple
+        特征名称列表，取值见 ``FEATURES``。
+
+    Returns
+    -------
+    FeaturePlan
+        执行计划，每个中间量仅出现一次，且位于其全部依赖之后。
+
+    Raises
+    ------
+    ValueError
+        输入非法或特征名称不支持时抛出。
+    """
+    if not isinstance(feature_types, (list, tuple)):
+        raise ValueError("feature_types must be a list or tuple")
+
+    intermediates = []
+    visited = set()
+
+    def visit(name):
+        if name in visited:
+            return
+        for dependency in INTERMEDIATES[name].inputs:
+            visit(dependency)
+        visited.add(name)
+        intermediates.append(name)
+
+    features = []
+    for feature_type in feature_types:
+        if feature_type not in FEATURES:
+            raise ValueError(f"Unsupported feature type: {feature_type}")
+        if feature_type in features:
+            continue
+        for dependency in FEATURES[feature_type].inputs:
+            visit(dependency)
+        features.append(feature_type)
+    return FeaturePlan(intermediates, features)
+
+
+def execute_plan(plan, context, extractor):
+    """在谱上下文上执行计划。
+
+    Parameters
+    ----------
+    plan : FeaturePlan
+        由 :func:`build_plan` 生成的执行计划。
+    context : SpectralContext
+        保存信号与中间量的谱上下文。
+    extractor : FeatureExtractor
+        提供 ``n_mfcc`` 等特征级配置的提取器。
+
+    Returns
+    -------
+    dict
+        特征字典，键为特征名称，值为 ``(n_frames, n_features)`` 的
+        ``float32`` 数组。
+    """
+    for name in plan.intermediates:
+        getattr(context, name)
+    return {
+        name: FEATURES[name].compute(context, extractor)
+        for name in plan.features
+    }
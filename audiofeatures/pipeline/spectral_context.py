@@ -0,0 +1,127 @@
+"""单次提取内共享的谱中间量。"""
+
+from functools import cached_property
+
+import librosa
+import numpy as np
+
+
+class SpectralContext:
+    """按需计算并缓存 STFT、幅度谱、功率谱、Mel 频谱等谱中间量。
+
+    同一次 ``extract_features`` 调用中的所有谱特征共享同一个上下文，
+    保证每种中间量只计算一次。
+
+    Parameters
+    ----------
+    signal : ndarray
+        一维 ``float32`` 输入信号。
+    sr : int
+        采样率（Hz）。
+    n_fft : int, optional
+        FFT 点数。
+    hop_length : int, optional
+        帧移（样本数）。
+    n_mels : int, optional
+        Mel 滤波器组数量。
+    window : str, optional
+        窗函数类型。
+    center : bool, optional
+        是否在帧中心对齐。
+    pad_mode : str, optional
+        边界填充模式。
+    log_mel_peak : float or None, optional
+        全局对数 Mel 峰值（dB）。给定时 ``log_mel`` 的 80 dB 动态范围截断以该值
+        为基准，而非本段信号的最大值，用于分块计算时与整段结果保持一致。
+
+    Notes
+    -----
+    谱矩阵沿用 ``librosa`` 的 ``(n_bins, n_frames)`` 布局，便于直接作为
+    ``S=`` 参数传入 ``librosa.feature`` 系列函数。
+    """
+
+    def __init__(
+        self,
+        signal,
+        sr,
+        n_fft=2048,
+        hop_length=512,
+        n_mels=128,
+        window="hann",
+        center=True,
+        pad_mode="constant",
+        log_mel_peak=None
+    ):
+        """初始化谱上下文。"""
+        self.signal = signal
+        self.sr = sr
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.n_mels = n_mels
+        self.window = window
+        self.center = center
+        self.pad_mode = pad_mode
+        self.log_mel_peak = log_mel_peak
+
+    @cached_property
+    def stft(self):
+        """复数 STFT，形状为 ``(1 + n_fft // 2, n_frames)``。"""
+        return librosa.stft(
+            y=self.signal,
+            n_fft=self.n_fft,
+            hop_length=self.hop_length,
+            window=self.window,
+            center=self.center,
+            pad_mode=self.pad_mode
+        )
+
+    @cached_property
+    def magnitude(self):
+        """幅度谱 ``|STFT|``。"""
+        return np.abs(self.stft)
+
+    @cached_property
+    def power(self):
+        """功率谱 ``|STFT| ** 2``。"""
+        return self.magnitude ** 2
+
+    @cached_property
+    def mel(self):
+        """由功率谱计算的 Mel 频谱，形状为 ``(n_mels, n_frames)``。"""
+        return librosa.feature.melspectrogram(
+            S=self.power,
+            sr=self.sr,
+            n_fft=self.n_fft,
+            n_mels=self.n_mels
+        )
+
+    @cached_property
+    def log_mel(self):
+        """对数功率 Mel 频谱（dB），与 ``librosa.feature.mfcc`` 内部一致。"""
+        if self.log_mel_peak is None:
+            return librosa.power_to_db(self.mel)
+        log_mel = librosa.power_to_db(self.mel, top_db=None)
+        return np.maximum(log_mel, self.log_mel_peak - 80.0)
+
+    @cached_property
+    def onset_envelope(self):
+        """由对数 Mel 频谱计算的起点强度包络，形状为 ``(n_frames,)``。"""
+        return librosa.onset.onset_strength(
+            S=self.log_mel,
+            sr=self.sr,
+            hop_length=self.hop_length
+        )
+
+    @cached_property
+    def harmonic(self):
+        """HPSS 分离得到的谐波时域信号，复用共享 STFT。"""
+        stft_harmonic = librosa.decompose.hpss(self.stft)[0]
+        return librosa.istft(
+            stft_harmonic,
+            n_fft=self.n_fft,
+            hop_length=self.hop_length,
+            window=self.window,
+            center=self.center,
+            length=self.signal.shape[-1],
+            dtype=self.signal.dtype
+        )
@@ -11,7 +11,8 @@ from .filtering import (
     low_pass_filter,
     high_pass_filter,
     band_pass_filter,
-    median_filter
+    median_filter,
+    StreamingFilter
 )
 from .normalization import (
     normalize_amplitude,
@@ -32,6 +33,7 @@ __all__ = [
     "high_pass_filter",
     "band_pass_filter",
     "median_filter",
+    "StreamingFilter",
     "normalize_amplitude",
     "peak_normalize",
     "z_normalize",
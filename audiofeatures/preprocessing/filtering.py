@@ -1,68 +1,153 @@
 """音频信号滤波工具。"""
 
+from functools import lru_cache
+
+import numpy as np
+from scipy import ndimage
 from scipy import signal as sci_signal
 
 from audiofeatures.utils.contract import ensure_float32
 
+_BTYPES = ("low", "high", "band")
+_MEDIAN_NETWORK_MAX_KERNEL = 5
+
+
+@lru_cache(maxsize=128)
+def _butter_sos(order, cutoff, sr, btype):
+    """设计并缓存巴特沃斯滤波器的二阶节（SOS）系数及其稳态初始状态。
+
+    ``cutoff`` 为截止频率（Hz），带通时为 ``(low, high)`` 元组。返回只读的
+    ``(sos, zi)``，``zi`` 为 ``sosfilt_zi(sos)``。
+    """
+    sos = sci_signal.butter(order, cutoff, btype=btype, fs=sr, output="sos")
+    zi = sci_signal.sosfilt_zi(sos)
+    sos.flags.writeable = False
+    zi.flags.writeable = False
+    return sos, zi
+
+
+def _design_sos(sr, cutoff, order, btype):
+    """校验参数并返回缓存的 ``(sos, zi)``。"""
+    if sr <= 0:
+        raise ValueError("sr must be > 0")
+    if btype == "band":
+        if np.shape(cutoff) != (2,):
+            raise ValueError("cutoff must be (low_cutoff, high_cutoff) for btype 'band'")
+        low, high = cutoff
+        if low <= 0 or high <= 0:
+            raise ValueError("cutoff frequencies must be > 0")
+        if low >= high:
+            raise ValueError("low_cutoff must be < high_cutoff")
+        cutoff = (float(low), float(high))
+    else:
+        if np.ndim(cutoff) != 0:
+            raise ValueError(f"cutoff must be a scalar for btype '{btype}'")
+        if cutoff <= 0:
+            raise ValueError("cutoff_freq must be > 0")
+        cutoff = high = float(cutoff)
+    if order <= 0:
+        raise ValueError("order must be > 0")
+    if high >= 0.5 * sr:
+        name = "high_cutoff" if btype == "band" else "cutoff_freq"
+        raise ValueError(f"{name} must be less than Nyquist frequency")
+    sos, zi = _butter_sos(int(order), cutoff, float(sr), btype)
+    # sosfilt 不接受只读系数，返回副本（仅 n_sections * 6 个数）
+    return sos.copy(), zi
+
+
+def _zero_phase(signal, sos, zi, axis):
+    """与 ``sosfiltfilt(sos, signal, axis=axis)`` 相同的零相位滤波，复用缓存的 ``zi``。
+
+    延拓长度与奇对称延拓沿用 ``sosfiltfilt`` 的默认规则；测试在奇偶阶、各滤波
+    类型与 ``padlen`` 边界长度上逐位对照 ``sosfiltfilt``，SciPy 行为变化时会失败。
+    """
+    if signal.ndim == 0:
+        raise ValueError("signal must have at least 1 dimension")
+    signal = np.moveaxis(signal, axis, -1)
+    n_sections = sos.shape[0]
+    n_taps = 2 * n_sections + 1
+    n_taps -= min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+    edge = 3 * n_taps
+    if signal.shape[-1] <= edge:
+        raise ValueError(
+            f"The length of the input vector x must be greater than padlen, which is {edge}."
+        )
+
+    # 奇对称延拓两端，减小边界瞬态
+    first = signal[..., :1]
+    last = signal[..., -1:]
+    extended = np.concatenate((
+        2 * first - signal[..., edge:0:-1],
+        signal,
+        2 * last - signal[..., -2:-(edge + 2):-1]
+    ), axis=-1)
+    # zi 形状 (n_sections, 2) 扩展为 (n_sections, ..., 2)，与批量维度广播
+    zi = zi.reshape((n_sections,) + (1,) * (signal.ndim - 1) + (2,))
+    filtered, _ = sci_signal.sosfilt(sos, extended, zi=zi * extended[..., :1])
+    filtered, _ = sci_signal.sosfilt(sos, filtered[..., ::-1], zi=zi * filtered[..., -1:])
+    filtered = filtered[..., ::-1][..., edge:-edge]
+    return np.moveaxis(filtered.astype(signal.dtype), -1, axis)
 
-def low_pass_filter(signal, sr, cutoff_freq, order=4):
+
+def low_pass_filter(signal, sr, cutoff_freq, order=4, axis=-1):
     """应用巴特沃斯低通滤波。
 
     Parameters
     ----------
     signal : ndarray
-        一维输入信号。
+        输入信号，可为一维或 ``(batch, n_samples)``、``(channels, n_samples)``
+        等多维数组。
     sr : int
         采样率（Hz）。
     cutoff_freq : float
         截止频率（Hz）。
     order : int, optional
         滤波器阶数。
+    axis : int, optional
+        沿该轴滤波，默认最后一轴。
 
     Returns
     -------
     ndarray
-        低通滤波后的信号。
+        低通滤波后的信号，形状与输入一致。
 
     Raises
     ------
     ValueError
         参数非法或超过奈奎斯特频率时抛出。
+
+    Notes
+    -----
+    滤波器以二阶节（SOS）形式设计，系数与初始状态按 ``(order, cutoff, sr,
+    btype)`` 缓存；零相位滤波与 ``sosfiltfilt`` 一致，高阶时也保持数值稳定。
+    多维输入在一次向量化调用中滤波全部片段或声道，无需逐条循环。
     """
     signal = ensure_float32(signal)
-    if sr <= 0:
-        raise ValueError("sr must be > 0")
-    if cutoff_freq <= 0:
-        raise ValueError("cutoff_freq must be > 0")
-    if order <= 0:
-        raise ValueError("order must be > 0")
-    nyquist = 0.5 * sr
-    if cutoff_freq >= nyquist:
-        raise ValueError("cutoff_freq must be less than Nyquist frequency")
-    normal_cutoff = cutoff_freq / nyquist
-    b, a = sci_signal.butter(order, normal_cutoff, btype="low", analog=False)
-    filtered = sci_signal.filtfilt(b, a, signal)
-    return filtered.astype(signal.dtype, copy=False)
+    sos, zi = _design_sos(sr, cutoff_freq, order, "low")
+    return _zero_phase(signal, sos, zi, axis)
 
 
-def high_pass_filter(signal, sr, cutoff_freq, order=4):
+def high_pass_filter(signal, sr, cutoff_freq, order=4, axis=-1):
     """应用巴特沃斯高通滤波。
 
     Parameters
     ----------
     signal : ndarray
-        一维输入信号。
+        输入信号，可为一维或 ``(batch, n_samples)``、``(channels, n_samples)``
+        等多维数组。
     sr : int
         采样率（Hz）。
     cutoff_freq : float
         截止频率（Hz）。
     order : int, optional
         滤波器阶数。
+    axis : int, optional
+        沿该轴滤波，默认最后一轴。
 
     Returns
     -------
     ndarray
-        高通滤波后的信号。
+        高通滤波后的信号，形状与输入一致。
 
     Raises
     ------
@@ -70,28 +155,18 @@ def high_pass_filter(signal, sr, cutoff_freq, order=4):
         参数非法或超过奈奎斯特频率时抛出。
     """
     signal = ensure_float32(signal)
-    if sr <= 0:
-        raise ValueError("sr must be > 0")
-    if cutoff_freq <= 0:
-        raise ValueError("cutoff_freq must be > 0")
-    if order <= 0:
-        raise ValueError("order must be > 0")
-    nyquist = 0.5 * sr
-    if cutoff_freq >= nyquist:
-        raise ValueError("cutoff_freq must be less than Nyquist frequency")
-    normal_cutoff = cutoff_freq / nyquist
-    b, a = sci_signal.butter(order, normal_cutoff, btype="high", analog=False)
-    filtered = sci_signal.filtfilt(b, a, signal)
-    return filtered.astype(signal.dtype, copy=False)
+    sos, zi = _design_sos(sr, cutoff_freq, order, "high")
+    return _zero_phase(signal, sos, zi, axis)
 
 
-def band_pass_filter(signal, sr, low_cutoff, high_cutoff, order=4):
+def band_pass_filter(signal, sr, low_cutoff, high_cutoff, order=4, axis=-1):
     """应用巴特沃斯带通滤波。
 
     Parameters
     ----------
     signal : ndarray
-        一维输入信号。
+        输入信号，可为一维或 ``(batch, n_samples)``、``(channels, n_samples)``
+        等多维数组。
     sr : int
         采样率（Hz）。
     low_cutoff : float
@@ -100,11 +175,13 @@ def band_pass_filter(signal, sr, low_cutoff, high_cutoff, order=4):
         高截止频率（Hz）。
     order : int, optional
         滤波器阶数。
+    axis : int, optional
+        沿该轴滤波，默认最后一轴。
 
     Returns
     -------
     ndarray
-        带通滤波后的信号。
+        带通滤波后的信号，形状与输入一致。
 
     Raises
     ------
@@ -112,46 +189,167 @@ def band_pass_filter(signal, sr, low_cutoff, high_cutoff, order=4):
         参数非法或超过奈奎斯特频率时抛出。
     """
     signal = ensure_float32(signal)
-    if sr <= 0:
-        raise ValueError("sr must be > 0")
-    if low_cutoff <= 0 or high_cutoff <= 0:
-        raise ValueError("cutoff frequencies must be > 0")
-    if low_cutoff >= high_cutoff:
-        raise ValueError("low_cutoff must be < high_cutoff")
-    if order <= 0:
-        raise ValueError("order must be > 0")
-    nyquist = 0.5 * sr
-    if high_cutoff >= nyquist:
-        raise ValueError("high_cutoff must be less than Nyquist frequency")
-    low = low_cutoff / nyquist
-    high = high_cutoff / nyquist
-    b, a = sci_signal.butter(order, [low, high], btype="band", analog=False)
-    filtered = sci_signal.filtfilt(b, a, signal)
-    return filtered.astype(signal.dtype, copy=False)
+    sos, zi = _design_sos(sr, (low_cutoff, high_cutoff), order, "band")
+    return _zero_phase(signal, sos, zi, axis)
+
 
+class StreamingFilter:
+    """逐块应用的因果巴特沃斯滤波器。
 
-def median_filter(signal, kernel_size=3):
+    Parameters
+    ----------
+    sr : int
+        采样率（Hz）。
+    cutoff : float or tuple of float
+        截止频率（Hz）；``btype="band"`` 时为 ``(low_cutoff, high_cutoff)``。
+    btype : {'low', 'high', 'band'}, optional
+        滤波器类型。
+    order : int, optional
+        滤波器阶数。
+    axis : int, optional
+        沿该轴滤波，默认最后一轴。多声道或批量块（如 ``(channels, n_samples)``）
+        的各条信号分别携带状态。
+
+    Attributes
+    ----------
+    sos : ndarray
+        二阶节系数，形状为 ``(n_sections, 6)``。
+
+    Raises
+    ------
+    ValueError
+        参数非法或超过奈奎斯特频率时抛出。
+
+    Notes
+    -----
+    - 使用 ``sosfilt`` 单向滤波，并在块之间携带滤波器状态 ``zi``（``float64``），
+      各块输出依次拼接后与对整段信号调用 ``sosfilt`` 的结果完全一致，内存
+      只与块大小有关。
+    - 单向滤波带有相位延迟；离线零相位滤波请使用 :func:`low_pass_filter`
+      等函数。
+    - 状态形状由第一个块确定，之后各块除 ``axis`` 外的形状必须一致。
+    - 处理新的信号前调用 :meth:`reset` 清零状态。
+
+    Examples
+    --------
+    >>> filt = StreamingFilter(16000, 4000, btype="low")
+    >>> for block in iter_audio_blocks("long.wav", 16000 * 10, sr=16000):
+    ...     filtered = filt.process(block)
+    """
+
+    def __init__(self, sr, cutoff, btype="low", order=4, axis=-1):
+        """设计滤波器并初始化状态。"""
+        if btype not in _BTYPES:
+            raise ValueError(f"btype must be one of {_BTYPES}")
+        self.sr = sr
+        self.cutoff = cutoff
+        self.btype = btype
+        self.order = order
+        self.axis = axis
+        self.sos, _ = _design_sos(sr, cutoff, order, btype)
+        self.reset()
+
+    def reset(self):
+        """将滤波器状态清零。"""
+        self._zi = None
+
+    def process(self, block):
+        """滤波一个信号块并更新状态。
+
+        Parameters
+        ----------
+        block : ndarray
+            信号块，沿 ``axis`` 的长度可以为 0。
+
+        Returns
+        -------
+        ndarray
+            滤波后的 ``float32`` 信号块，形状与输入一致。
+
+        Raises
+        ------
+        ValueError
+            块的形状与之前的块不一致时抛出。
+        """
+        block = ensure_float32(block)
+        if block.ndim == 0:
+            raise ValueError("block must have at least 1 dimension")
+        axis = self.axis % block.ndim
+        state_shape = (self.sos.shape[0],) + block.shape[:axis] + (2,) + block.shape[axis + 1:]
+        if self._zi is None:
+            self._zi = np.zeros(state_shape, dtype=np.float64)
+        elif self._zi.shape != state_shape:
+            raise ValueError("block shape does not match previous blocks")
+        if block.shape[axis] == 0:
+            return block.copy()
+        filtered, self._zi = sci_signal.sosfilt(self.sos, block, axis=axis, zi=self._zi)
+        return filtered.astype(np.float32, copy=False)
+
+
+def _median_network(lines, kernel_size):
+    """以 min/max 比较交换网络（奇偶换位排序）逐位置求中值，对所有行向量化。"""
+    half = kernel_size // 2
+    n_samples = lines.shape[-1]
+    padded = np.zeros(lines.shape[:-1] + (n_samples + 2 * half,), dtype=lines.dtype)
+    padded[..., half:half + n_samples] = lines
+    values = [padded[..., offset:offset + n_samples].copy() for offset in range(kernel_size)]
+    for step in range(kernel_size):
+        for i in range(step % 2, kernel_size - 1, 2):
+            low = np.minimum(values[i], values[i + 1])
+            np.maximum(values[i], values[i + 1], out=values[i + 1])
+            values[i] = low
+    return values[half]
+
+
+def median_filter(signal, kernel_size=3, axis=-1):
     """应用中值滤波以去除脉冲噪声。
 
     Parameters
     ----------
     signal : ndarray
-        一维输入信号。
+        输入信号，可为一维或多维数组。
     kernel_size : int, optional
         滤波核大小（必须为奇数）。
+    axis : int, optional
+        沿该轴滤波，默认最后一轴；其余各轴的核大小为 1，各条信号互不影响。
 
     Returns
     -------
     ndarray
-        中值滤波后的信号。
+        中值滤波后的信号，形状与输入一致。
 
     Raises
     ------
     ValueError
         ``kernel_size`` 非正奇数时抛出。
+
+    Notes
+    -----
+    结果与 ``scipy.signal.medfilt``（两端补零）一致，按核大小自动选择实现：
+
+    - ``kernel_size <= 5`` 且输入不含 NaN 时，对全部信号向量化执行 min/max
+      比较交换网络；
+    - 更大的核逐条调用一维 ``scipy.ndimage.median_filter``。SciPy 对一维输入
+      使用双堆滑动中值，复杂度为 ``O(n log k)``；多维输入直接交给
+      ``medfilt`` 会退化为逐窗口选择，``O(n k)``。
+
+    各实现的耗时对比见 ``benchmarks/bench_median_filter.py``。
     """
     signal = ensure_float32(signal)
     if kernel_size <= 0 or kernel_size % 2 == 0:
         raise ValueError("kernel_size must be a positive odd integer")
-    filtered = sci_signal.medfilt(signal, kernel_size=kernel_size)
-    return filtered.astype(signal.dtype, copy=False)
+    if signal.ndim == 0:
+        raise ValueError("signal must have at least 1 dimension")
+    if kernel_size == 1:
+        return signal.copy()
+
+    moved = np.moveaxis(signal, axis, -1)
+    if kernel_size <= _MEDIAN_NETWORK_MAX_KERNEL and not np.isnan(moved).any():
+        filtered = _median_network(moved, kernel_size)
+    else:
+        lines = moved.reshape(-1, moved.shape[-1])
+        filtered = np.empty(lines.shape, dtype=signal.dtype)
+        for line, out in zip(lines, filtered):
+            ndimage.median_filter(line, size=kernel_size, mode="constant", output=out)
+        filtered = filtered.reshape(moved.shape)
+    return np.moveaxis(filtered, -1, axis)
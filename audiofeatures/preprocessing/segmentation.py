@@ -3,10 +3,31 @@
 import numpy as np
 import warnings
 
+from audiofeatures.core.signal_processing import frame_signal
 from audiofeatures.utils.contract import ensure_float32
 
 
-def segment_by_energy(signal, sr, threshold=0.05, min_length=0.1):
+def _active_runs(active):
+    """返回布尔序列中连续 ``True`` 段的起点与（含）终点索引。"""
+    if active.size == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    changes = np.flatnonzero(active[1:] != active[:-1]) + 1
+    rising = active[changes]
+    starts = changes[rising]
+    ends = changes[~rising] - 1
+    if active[0]:
+        starts = np.concatenate(([0], starts))
+    if active[-1]:
+        ends = np.concatenate((ends, [active.size - 1]))
+    return starts, ends
+
+
+def segment_by_energy(
+        signal, sr,
+        threshold=0.05, min_length=0.1,
+        frame_length=None, hop_length=None
+    ):
     """基于能量阈值进行分段。
 
     Parameters
@@ -19,11 +40,17 @@ def segment_by_energy(signal, sr, threshold=0.05, min_length=0.1):
         能量阈值，范围 [0, 1]。
     min_length : float, optional
         片段最小时长（秒）。
+    frame_length : float or None, optional
+        帧级模式的分析帧长度（秒），默认等于 ``hop_length``。
+    hop_length : float or None, optional
+        帧移（秒）。给定时按帧计算平均能量（帧级模式），否则逐样本计算。
 
     Returns
     -------
     list of tuple
-        片段列表，每个元素为 ``(start_idx, end_idx)``。
+        片段列表，每个元素为 ``(start_idx, end_idx)``，``end_idx`` 为片段最后
+        一个样本的索引。帧级模式下片段覆盖首个活动帧的起点到最后一个活动帧的
+        终点。
 
     Raises
     ------
@@ -34,6 +61,11 @@ def segment_by_energy(signal, sr, threshold=0.05, min_length=0.1):
     -----
     UserWarning
         当信号能量接近 0 时返回空列表。
+
+    Notes
+    -----
+    连续活动区间由 ``np.diff`` 与 ``np.flatnonzero`` 一次求出，最小时长过滤
+    同样向量化完成，逐样本模式的结果与逐点扫描一致。
     """
     signal = ensure_float32(signal)
     if signal.ndim != 1:
@@ -45,33 +77,39 @@ def segment_by_energy(signal, sr, threshold=0.05, min_length=0.1):
     if min_length < 0:
         raise ValueError("min_length must be >= 0")
 
-    energy = signal ** 2
+    if hop_length is None:
+        if frame_length is not None:
+            raise ValueError("frame_length requires hop_length")
+        energy = signal ** 2
+    else:
+        if frame_length is None:
+            frame_length = hop_length
+        if frame_length <= 0 or hop_length <= 0:
+            raise ValueError("frame_length and hop_length must be > 0")
+        if frame_length < hop_length:
+            raise ValueError("frame_length must be >= hop_length")
+        frame_samples = max(1, int(frame_length * sr))
+        hop_samples = max(1, int(hop_length * sr))
+        frames = frame_signal(signal, frame_length=frame_samples, hop_length=hop_samples, center=False)
+        if frames.shape[0] == 0:
+            warnings.warn("信号长度小于帧长度，无法进行分段")
+            return []
+        energy = np.mean(frames ** 2, axis=1)
+
     max_energy = np.max(energy)
 
     if np.isclose(max_energy, 0.0, atol=np.finfo(signal.dtype).eps):
         warnings.warn("信号能量过低，可能无法检测到有效片段")
         return []
 
-    norm_energy = energy / max_energy
-
-    indices = np.where(norm_energy > threshold)[0]
-    if len(indices) == 0:
-        return []
-
-    segments = []
-    start = indices[0]
-    for i in range(1, len(indices)):
-        if indices[i] - indices[i - 1] > 1:
-            end = indices[i - 1]
-            if (end - start) / sr >= min_length:
-                segments.append((start, end))
-            start = indices[i]
+    energy /= max_energy
 
-    end = indices[-1]
-    if (end - start) / sr >= min_length:
-        segments.append((start, end))
-
-    return segments
+    starts, ends = _active_runs(energy > threshold)
+    if hop_length is not None:
+        starts = starts * hop_samples
+        ends = ends * hop_samples + frame_samples - 1
+    keep = (ends - starts) / sr >= min_length
+    return list(zip(starts[keep], ends[keep]))
 
 
 def segment_by_zcr(
@@ -110,6 +148,11 @@ def segment_by_zcr(
     -----
     UserWarning
         当信号长度不足一帧时返回空列表。
+
+    Notes
+    -----
+    各帧过零数由一次符号变化数组的累积和按帧起点差分得到，片段边界由活动
+    掩码的边沿检测得到，均无逐帧 Python 循环。
     """
     signal = ensure_float32(signal)
     if signal.ndim != 1:
@@ -127,37 +170,24 @@ def segment_by_zcr(
 
     frame_length_samples = int(frame_length * sr)
     hop_length_samples = int(hop_length * sr)
+    if hop_length_samples <= 0 or frame_length_samples < 2:
+        raise ValueError("frame_length and hop_length are too short for this sample rate")
 
     if len(signal) < frame_length_samples:
         warnings.warn("信号长度小于帧长度，无法进行分段")
         return []
 
-    zcr = []
-    for i in range(0, len(signal) - frame_length_samples, hop_length_samples):
-        frame = signal[i:i + frame_length_samples]
-        zero_crossings = np.sum(np.abs(np.diff(np.signbit(frame).astype(int))))
-        zcr.append(zero_crossings / (frame_length_samples - 1))
-
-    zcr = np.array(zcr)
-    active = zcr > threshold
-
-    segments = []
-    in_segment = False
-    start_frame = 0
-
-    for i, is_active in enumerate(active):
-        if is_active and not in_segment:
-            in_segment = True
-            start_frame = i
-        elif not is_active and in_segment:
-            in_segment = False
-            start_idx = start_frame * hop_length_samples
-            end_idx = i * hop_length_samples + frame_length_samples
-            if (end_idx - start_idx) / sr >= min_length:
-                segments.append((start_idx, end_idx))
-    if in_segment:
-        start_idx = start_frame * hop_length_samples
-        end_idx = len(active) * hop_length_samples + frame_length_samples
-        if (end_idx - start_idx) / sr >= min_length:
-            segments.append((start_idx, end_idx))
-    return segments
+    # 相邻样本符号变化的累积和：帧 [i, i + F) 内的过零数为 c[i + F - 1] - c[i]
+    signs = np.signbit(signal)
+    count_dtype = np.int32 if len(signal) < np.iinfo(np.int32).max else np.int64
+    cumulative = np.zeros(len(signal), dtype=count_dtype)
+    np.cumsum(signs[1:] != signs[:-1], dtype=count_dtype, out=cumulative[1:])
+    starts = np.arange(0, len(signal) - frame_length_samples, hop_length_samples)
+    crossings = cumulative[starts + frame_length_samples - 1] - cumulative[starts]
+    zcr = crossings / (frame_length_samples - 1)
+
+    start_frames, end_frames = _active_runs(zcr > threshold)
+    start_idx = start_frames * hop_length_samples
+    end_idx = (end_frames + 1) * hop_length_samples + frame_length_samples
+    keep = (end_idx - start_idx) / sr >= min_length
+    return list(zip(start_idx[keep].tolist(), end_idx[keep].tolist()))
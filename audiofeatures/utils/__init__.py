@@ -9,7 +9,8 @@ from .conversion import (
     samples_to_seconds
 )
 from .contract import ensure_float32, to_feature_matrix
-from .io import load_audio, save_audio, save_features, load_features
+from .io import load_audio, save_audio, save_features, load_features, LazyFeatures
+from .feature_store import FeatureStore, FeatureStoreWriter
 
 __all__ = [
     "hz_to_mel",
@@ -23,5 +24,8 @@ __all__ = [
     "load_audio",
     "save_audio",
     "save_features",
-    "load_features"
+    "load_features",
+    "LazyFeatures",
+    "FeatureStore",
+    "FeatureStoreWriter"
 ]
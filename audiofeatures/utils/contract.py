@@ -20,7 +20,10 @@ def ensure_float32(signal, clip=False):
     """
     arr = np.asarray(signal, dtype=np.float32)
     if clip:
-        np.clip(arr, -1.0, 1.0, out=arr)
+        if arr.flags.writeable:
+            np.clip(arr, -1.0, 1.0, out=arr)
+        else:
+            arr = np.clip(arr, -1.0, 1.0)
     return arr
 
 
@@ -0,0 +1,252 @@
+"""分片存储的帧级特征数据集。
+
+目录结构::
+
+    root/
+        index-<writer>.jsonl          # 每行一个片段：clip_id -> 分片与各特征的位置
+        <writer>-00000/<feature>.bin  # 同一分片内各片段的特征按行追加
+        <writer>-00001/...
+
+每个写入者只追加自己的分片与索引文件，多个进程可并行写入同一目录；
+索引行在数据写入完成后才追加，读取方不会看到写了一半的片段。
+"""
+
+import json
+import os
+import re
+import uuid
+import zlib
+
+import numpy as np
+
+from audiofeatures.utils.contract import to_feature_matrix
+
+_CODECS = (None, "zlib")
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.\-]+$")
+
+
+class FeatureStore:
+    """按片段随机读取的分片特征库。
+
+    Parameters
+    ----------
+    root : str
+        数据集目录，不存在时自动创建。
+
+    Notes
+    -----
+    - 未压缩分片的特征以只读 ``np.memmap`` 视图返回，读取单个片段只触及
+      该片段所在的页；``codec="zlib"`` 的片段在访问时单独解压，无法内存映射。
+    - 不同写入者写入相同 ``clip_id`` 时，按索引文件名顺序以后读到的为准。
+    - 写入新数据后调用 :meth:`refresh` 重新加载索引。
+
+    Examples
+    --------
+    >>> store = FeatureStore("dataset")
+    >>> with store.writer() as writer:
+    ...     writer.append("clip-001", {"mfcc": mfcc, "rms": rms})
+    >>> store.refresh()
+    >>> store["clip-001"]["mfcc"].shape
+    (431, 13)
+    """
+
+    def __init__(self, root):
+        """打开或创建数据集目录。"""
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._index = {}
+        self._maps = {}
+        self.refresh()
+
+    def refresh(self):
+        """重新读取全部索引文件。"""
+        index = {}
+        for name in sorted(os.listdir(self.root)):
+            if not (name.startswith("index-") and name.endswith(".jsonl")):
+                continue
+            with open(os.path.join(self.root, name), "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    entry = json.loads(line)
+                    index[entry["clip_id"]] = entry
+        self._index = index
+        self._maps = {}
+
+    def writer(self, writer_id=None, shard_bytes=256 * 1024 ** 2, codec=None):
+        """创建追加写入器。
+
+        Parameters
+        ----------
+        writer_id : str or None, optional
+            写入者标识，并行写入时各进程需不同。默认由进程号与随机串生成。
+        shard_bytes : int, optional
+            单个分片的目标大小（字节），超过后切换到新分片。
+        codec : {None, 'zlib'}, optional
+            片段编码。``None`` 为未压缩，可内存映射；``zlib`` 为快速压缩
+            （level 1），读取时逐片段解压。
+
+        Returns
+        -------
+        FeatureStoreWriter
+            写入器，可作为上下文管理器使用。
+        """
+        return FeatureStoreWriter(self.root, writer_id, shard_bytes, codec)
+
+    def clip_ids(self):
+        """返回全部片段标识。"""
+        return list(self._index)
+
+    def info(self, clip_id):
+        """返回片段的索引条目（分片、各特征偏移与帧数）。"""
+        return self._index[clip_id]
+
+    def get(self, clip_id, keys=None):
+        """读取片段特征。
+
+        Parameters
+        ----------
+        clip_id : str
+            片段标识。
+        keys : list of str or None, optional
+            只读取这些特征，为 ``None`` 时读取全部。
+
+        Returns
+        -------
+        dict
+            特征字典，值为 ``(n_frames, n_features)`` 的 ``float32`` 数组。
+
+        Raises
+        ------
+        KeyError
+            片段或特征不存在时抛出。
+        """
+        entry = self._index[clip_id]
+        names = entry["features"] if keys is None else keys
+        return {name: self._read(entry, name) for name in names}
+
+    def __getitem__(self, clip_id):
+        return self.get(clip_id)
+
+    def __contains__(self, clip_id):
+        return clip_id in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def _read(self, entry, name):
+        location = entry["features"][name]
+        path = os.path.join(self.root, entry["shard"], name + ".bin")
+        shape = (location["n_frames"], location["n_features"])
+        if entry.get("codec") == "zlib":
+            with open(path, "rb") as f:
+                f.seek(location["offset"])
+                raw = zlib.decompress(f.read(location["nbytes"]))
+            return np.frombuffer(raw, dtype="<f4").reshape(shape)
+
+        if location["nbytes"] == 0:
+            return np.zeros(shape, dtype=np.float32)
+        end = location["offset"] + location["nbytes"]
+        mapped = self._maps.get(path)
+        if mapped is None or mapped.shape[0] < end:
+            mapped = np.memmap(path, dtype=np.uint8, mode="r")
+            self._maps[path] = mapped
+        return mapped[location["offset"]:end].view("<f4").reshape(shape)
+
+
+class FeatureStoreWriter:
+    """:class:`FeatureStore` 的追加写入器，由 :meth:`FeatureStore.writer` 创建。"""
+
+    def __init__(self, root, writer_id, shard_bytes, codec):
+        """初始化写入器。"""
+        if codec not in _CODECS:
+            raise ValueError(f"codec must be one of {_CODECS}")
+        if shard_bytes <= 0:
+            raise ValueError("shard_bytes must be > 0")
+        if writer_id is None:
+            writer_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        if not _NAME_PATTERN.match(writer_id):
+            raise ValueError(f"invalid writer_id: {writer_id}")
+        self.root = root
+        self.writer_id = writer_id
+        self.shard_bytes = shard_bytes
+        self.codec = codec
+        self._shard_index = self._next_shard_index()
+        self._shard_size = 0
+        self._index_file = open(
+            os.path.join(root, f"index-{writer_id}.jsonl"), "a", encoding="utf-8"
+        )
+
+    def append(self, clip_id, features):
+        """追加一个片段。
+
+        Parameters
+        ----------
+        clip_id : str
+            片段标识。
+        features : dict
+            特征字典，值为一维或 ``(n_frames, n_features)`` 数组，以 ``float32``
+            保存。
+
+        Raises
+        ------
+        ValueError
+            输入非法时抛出。
+        """
+        if not isinstance(clip_id, str):
+            raise ValueError("clip_id must be a str")
+        if not isinstance(features, dict) or not features:
+            raise ValueError("features must be a non-empty dict")
+        for name in features:
+            if not _NAME_PATTERN.match(name):
+                raise ValueError(f"invalid feature name: {name}")
+        if self._shard_size >= self.shard_bytes:
+            self._shard_index += 1
+            self._shard_size = 0
+
+        shard = f"{self.writer_id}-{self._shard_index:05d}"
+        shard_dir = os.path.join(self.root, shard)
+        os.makedirs(shard_dir, exist_ok=True)
+
+        locations = {}
+        for name, values in features.items():
+            matrix = np.ascontiguousarray(to_feature_matrix(values), dtype="<f4")
+            payload = matrix.tobytes()
+            if self.codec == "zlib":
+                payload = zlib.compress(payload, 1)
+            with open(os.path.join(shard_dir, name + ".bin"), "ab") as f:
+                offset = f.tell()
+                f.write(payload)
+            locations[name] = {
+                "offset": offset,
+                "nbytes": len(payload),
+                "n_frames": matrix.shape[0],
+                "n_features": matrix.shape[1]
+            }
+            self._shard_size += len(payload)
+
+        entry = {"clip_id": clip_id, "shard": shard, "codec": self.codec, "features": locations}
+        self._index_file.write(json.dumps(entry) + "\n")
+        self._index_file.flush()
+
+    def close(self):
+        """关闭索引文件。"""
+        self._index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _next_shard_index(self):
+        prefix = self.writer_id + "-"
+        existing = [
+            int(name[len(prefix):])
+            for name in os.listdir(self.root)
+            if name.startswith(prefix) and name[len(prefix):].isdigit()
+        ]
+        return max(existing) + 1 if existing else 0
@@ -1,5 +1,14 @@
 """音频与特征文件 I/O 工具。"""
 
+from collections.abc import Mapping
+import io
+import json
+import os
+import struct
+import warnings
+import zipfile
+import zlib
+
 import numpy as np
 import soundfile as sf
 
@@ -7,7 +16,7 @@ from audiofeatures.core.audio_loader import load_audio as core_load_audio
 from audiofeatures.utils.contract import ensure_float32
 
 
-def load_audio(file_path, sr=None, mono=True):
+def load_audio(file_path, sr=None, mono=True, res_type="soxr_hq"):
     """读取音频文件。
 
     Parameters
@@ -18,6 +27,8 @@ def load_audio(file_path, sr=None, mono=True):
         目标采样率，为 ``None`` 时保持原采样率。
     mono : bool, optional
         是否转换为单声道。
+    res_type : str, optional
+        重采样方法，见 ``audiofeatures.core.audio_loader.load_audio``。
 
     Returns
     -------
@@ -29,7 +40,7 @@ def load_audio(file_path, sr=None, mono=True):
     -----
     实际读取由 ``audiofeatures.core.audio_loader.load_audio`` 完成。
     """
-    return core_load_audio(file_path, sr=sr, mono=mono)
+    return core_load_audio(file_path, sr=sr, mono=mono, res_type=res_type)
 
 
 def save_audio(signal, sr, file_path):
@@ -58,7 +69,82 @@ def save_audio(signal, sr, file_path):
     sf.write(file_path, signal, sr)
 
 
-def save_features(features, file_path):
+COMPRESSIONS = ("none", "zlib", "lz4", "zstd", "fast")
+
+_FLOAT16_MAX = float(np.finfo(np.float16).max)
+_SHUFFLED_SUFFIX = ".shuf"
+_SHUFFLED_MAGIC = b"AFSHUF\x01\x00"
+
+
+def _codec(name):
+    """返回 ``(codec_name, compress, decompress)``；可选依赖缺失时返回 ``None``。"""
+    if name == "lz4":
+        try:
+            import lz4.frame
+        except ImportError:
+            return None
+        return (
+            "lz4",
+            lambda data, level: lz4.frame.compress(data, compression_level=level or 0),
+            lz4.frame.decompress
+        )
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            return None
+        return (
+            "zstd",
+            lambda data, level: zstandard.ZstdCompressor(level=level or 3).compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data)
+        )
+    return (
+        "zlib",
+        lambda data, level: zlib.compress(data, 1 if level is None else level),
+        zlib.decompress
+    )
+
+
+def _shuffled_codec(compression):
+    """按 ``compression`` 选择字节重排后使用的编码，缺失时回退到标准库 ``zlib``。"""
+    if compression == "fast":
+        return _codec("zstd") or _codec("lz4") or _codec("zlib")
+    codec = _codec(compression)
+    if codec is None:
+        warnings.warn(f"未安装 {compression} 对应的依赖，回退到字节重排 + zlib 压缩")
+        codec = _codec("zlib")
+    return codec
+
+
+def _encode_shuffled(array, codec, level):
+    """字节重排后压缩：同一字节位（如 float32 的指数字节）连续存放，更易压缩。"""
+    name, compress, _ = codec
+    array = np.ascontiguousarray(array)
+    itemsize = array.dtype.itemsize
+    shuffled = array.reshape(-1).view(np.uint8).reshape(-1, itemsize).T.tobytes()
+    header = json.dumps({
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "codec": name
+    }).encode("utf-8")
+    return _SHUFFLED_MAGIC + struct.pack("<I", len(header)) + header + compress(shuffled, level)
+
+
+def _decode_shuffled(payload):
+    if payload[:8] != _SHUFFLED_MAGIC:
+        raise ValueError("not a shuffled feature member")
+    header_length = struct.unpack("<I", payload[8:12])[0]
+    header = json.loads(payload[12:12 + header_length].decode("utf-8"))
+    codec = _codec(header["codec"])
+    if codec is None:
+        raise ImportError(f"reading this member requires the '{header['codec']}' codec")
+    dtype = np.dtype(header["dtype"])
+    raw = np.frombuffer(codec[2](payload[12 + header_length:]), dtype=np.uint8)
+    data = raw.reshape(dtype.itemsize, -1).T.copy().view(dtype)
+    return data.reshape(header["shape"])
+
+
+def save_features(features, file_path, compression="zlib", level=None, dtype=None):
     """将特征字典保存为 ``.npz`` 文件。
 
     Parameters
@@ -66,31 +152,184 @@ def save_features(features, file_path):
     features : dict
         特征字典，键为名称、值为数组。
     file_path : str
-        输出路径（建议以 ``.npz`` 结尾）。
+        输出路径。与 ``np.savez`` 一致，缺少 ``.npz`` 后缀时自动补上。
+    compression : {'none', 'zlib', 'lz4', 'zstd', 'fast'}, optional
+        压缩方式：
+
+        - ``none``：不压缩，:func:`load_features` 可直接内存映射；
+        - ``zlib``：标准 ``.npz`` 压缩（与 ``np.savez_compressed`` 兼容）；
+        - ``lz4`` / ``zstd``：字节重排后使用对应编码，未安装依赖时回退到
+          字节重排 + ``zlib`` 并发出警告；
+        - ``fast``：字节重排后使用可用的最快编码（zstd、lz4，否则 zlib level 1）。
+    level : int or None, optional
+        压缩等级，``None`` 时使用各编码的默认值（``zlib`` 为 6，字节重排路径
+        的 ``zlib`` 为 1）。
+    dtype : {None, 'float16'}, optional
+        存储精度。``float16`` 将浮点特征减半存储。
 
     Raises
     ------
     ValueError
-        ``features`` 不是字典时抛出。
+        ``features`` 不是字典、参数不支持，或 ``float16`` 存储时数值超出
+        ``±65504`` 时抛出。
+
+    Notes
+    -----
+    - 字节重排格式的成员（``<key>.shuf``）只能由 :func:`load_features` 读取；
+      ``none`` 与 ``zlib`` 写出的文件仍可由 ``np.load`` 直接读取。
+    - ``float16`` 的相对误差不超过 ``2**-11``（约 ``4.9e-4``）；绝对值小于
+      ``2**-14``（约 ``6.1e-5``）的次正规数绝对误差不超过 ``2**-25``。读取时保持
+      ``float16``，需要时请自行 ``astype(np.float32)``。
     """
     if not isinstance(features, dict):
         raise ValueError("features must be a dict")
-    arrays = {key: np.asarray(value) for key, value in features.items()}
-    np.savez_compressed(file_path, **arrays)
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"compression must be one of {COMPRESSIONS}")
+    if dtype not in (None, "float16", np.float16):
+        raise ValueError("dtype must be None or 'float16'")
+    if not hasattr(file_path, "write"):
+        file_path = os.fspath(file_path)
+        if not file_path.endswith(".npz"):
+            file_path = file_path + ".npz"
+
+    arrays = {}
+    for key, value in features.items():
+        array = np.asarray(value)
+        if dtype is not None and array.dtype.kind == "f":
+            if array.size and np.max(np.abs(array)) > _FLOAT16_MAX:
+                raise ValueError(f"feature '{key}' exceeds the float16 range")
+            array = array.astype(np.float16)
+        arrays[key] = array
+
+    if compression == "none":
+        np.savez(file_path, **arrays)
+        return
+    if compression == "zlib":
+        with zipfile.ZipFile(
+            file_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=level, allowZip64=True
+        ) as archive:
+            for key, array in arrays.items():
+                with archive.open(key + ".npy", "w", force_zip64=True) as member:
+                    np.lib.format.write_array(member, np.asanyarray(array), allow_pickle=False)
+        return
 
+    codec = _shuffled_codec(compression)
+    with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for key, array in arrays.items():
+            archive.writestr(key + _SHUFFLED_SUFFIX, _encode_shuffled(array, codec, level))
 
-def load_features(file_path):
-    """从 ``.npz`` 文件读取特征。
+
+class LazyFeatures(Mapping):
+    """按需读取 ``.npz`` 成员的只读映射，由 :func:`load_features` 创建。
+
+    未压缩（``ZIP_STORED``）的成员在 ``mmap=True`` 时直接从归档文件内存映射；
+    压缩成员在首次访问时解码并缓存。
+    """
+
+    def __init__(self, file_path, mmap=True, keys=None):
+        """读取归档目录，不解码任何数组。"""
+        self.file_path = file_path
+        self.mmap = mmap
+        with zipfile.ZipFile(file_path) as archive:
+            members = {
+                info.filename[:-4] if info.filename.endswith(".npy")
+                else info.filename[:-len(_SHUFFLED_SUFFIX)]: info
+                for info in archive.infolist()
+                if info.filename.endswith((".npy", _SHUFFLED_SUFFIX))
+            }
+        if keys is not None:
+            missing = [key for key in keys if key not in members]
+            if missing:
+                raise KeyError(f"features not found: {missing}")
+            members = {key: members[key] for key in keys}
+        self._members = members
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            info = self._members[key]
+            value = None
+            shuffled = info.filename.endswith(_SHUFFLED_SUFFIX)
+            if self.mmap and not shuffled and info.compress_type == zipfile.ZIP_STORED:
+                value = self._map_member(info)
+            if value is None:
+                with zipfile.ZipFile(self.file_path) as archive:
+                    payload = archive.read(info)
+                if shuffled:
+                    value = _decode_shuffled(payload)
+                else:
+                    value = np.load(io.BytesIO(payload), allow_pickle=False)
+            self._cache[key] = value
+        return self._cache[key]
+
+    def __contains__(self, key):
+        return key in self._members
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __len__(self):
+        return len(self._members)
+
+    def __repr__(self):
+        return f"LazyFeatures({self.file_path!r}, keys={list(self._members)})"
+
+    def _map_member(self, info):
+        """解析本地文件头与 ``.npy`` 头，返回成员数据的内存映射；不支持时返回 ``None``。"""
+        with open(self.file_path, "rb") as f:
+            f.seek(info.header_offset)
+            local_header = f.read(30)
+            name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            else:
+                return None
+            offset = f.tell()
+        if dtype.hasobject:
+            return None
+        if int(np.prod(shape)) == 0:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(
+            self.file_path,
+            dtype=dtype,
+            mode="r",
+            offset=offset,
+            shape=shape,
+            order="F" if fortran_order else "C"
+        )
+
+
+def load_features(file_path, mmap=True, keys=None):
+    """从 ``.npz`` 文件惰性读取特征。
 
     Parameters
     ----------
     file_path : str
         特征文件路径。
+    mmap : bool, optional
+        是否对未压缩成员使用内存映射。为 ``False`` 时在访问时读入内存。
+    keys : list of str or None, optional
+        只暴露这些特征，为 ``None`` 时包含全部成员。
 
     Returns
     -------
-    dict
-        特征字典。
+    LazyFeatures
+        只读映射，接口与字典相同；数组在首次访问时才读取。
+
+    Raises
+    ------
+    KeyError
+        ``keys`` 中包含不存在的特征时抛出。
+
+    Notes
+    -----
+    ``np.savez`` 或 ``save_features(compression="none")`` 写出的未压缩归档可直接
+    内存映射，返回只读 ``np.memmap``；压缩成员（含字节重排格式）无法映射，只在
+    访问时解码所请求的成员。
+    需要普通字典时使用 ``dict(load_features(path))``。
     """
-    with np.load(file_path) as data:
-        return {key: data[key] for key in data.files}
+    return LazyFeatures(file_path, mmap=mmap, keys=keys)
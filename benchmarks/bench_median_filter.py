@@ -0,0 +1,81 @@
+"""中值滤波基准。
+
+在单条长信号（60 s @ 16 kHz）与批量片段（``(32, 16000)``，沿最后一轴）上，
+比较各核大小下：
+
+- ``medfilt``：直接调用 ``scipy.signal.medfilt``（批量时核为 ``(1, k)``）；
+- ``network``：min/max 比较交换网络，对全部信号向量化；
+- ``running``：逐条调用一维 ``scipy.ndimage.median_filter``（双堆滑动中值）；
+- ``median_filter``：按核大小自动选择后的实际耗时。
+
+用于确定 ``_MEDIAN_NETWORK_MAX_KERNEL`` 的交叉点。批量 ``medfilt`` 在大核下
+耗时过长，超过 ``MEDFILT_BATCH_MAX_KERNEL`` 时跳过。
+
+运行方式（需先 ``pip install -e .``）::
+
+    python benchmarks/bench_median_filter.py
+"""
+
+import time
+
+import numpy as np
+from scipy import ndimage
+from scipy import signal as sci_signal
+
+from audiofeatures.preprocessing.filtering import _median_network, median_filter
+
+SR = 16000
+KERNEL_SIZES = (3, 5, 7, 11, 31, 101, 301, 1001)
+NETWORK_MAX_KERNEL = 11
+MEDFILT_BATCH_MAX_KERNEL = 101
+REPEATS = 3
+
+
+def best_time(func):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def running_median(signal, kernel_size):
+    lines = signal.reshape(-1, signal.shape[-1])
+    filtered = np.empty_like(lines)
+    for line, out in zip(lines, filtered):
+        ndimage.median_filter(line, size=kernel_size, mode="constant", output=out)
+    return filtered.reshape(signal.shape)
+
+
+def format_ms(elapsed):
+    return "      skip" if elapsed is None else f"{elapsed * 1e3:10.1f}"
+
+
+def main():
+    rng = np.random.default_rng(0)
+    cases = {
+        "60 s signal": rng.standard_normal(SR * 60).astype(np.float32),
+        "32 x 1 s batch": rng.standard_normal((32, SR)).astype(np.float32),
+    }
+    for name, signal in cases.items():
+        print(f"{name} (ms)")
+        print(f"  {'kernel':>6s} {'medfilt':>10s} {'network':>10s} {'running':>10s} {'auto':>10s}")
+        for kernel_size in KERNEL_SIZES:
+            kernel = [1] * (signal.ndim - 1) + [kernel_size]
+            medfilt = None
+            if signal.ndim == 1 or kernel_size <= MEDFILT_BATCH_MAX_KERNEL:
+                medfilt = best_time(lambda: sci_signal.medfilt(signal, kernel))
+            network = None
+            if kernel_size <= NETWORK_MAX_KERNEL:
+                network = best_time(lambda: _median_network(signal, kernel_size))
+            running = best_time(lambda: running_median(signal, kernel_size))
+            auto = best_time(lambda: median_filter(signal, kernel_size))
+            print(
+                f"  {kernel_size:6d} {format_ms(medfilt)} {format_ms(network)} "
+                f"{format_ms(running)} {format_ms(auto)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""重采样基准。
+
+比较 ``load_audio`` 各 ``res_type`` 在 44.1 kHz → 16 kHz（主要加载路径）上的
+吞吐量，以实时倍率（每秒处理的音频秒数）表示；``polyphase`` 同时给出
+未缓存滤波器设计时的耗时作为对照。
+
+运行方式（需先 ``pip install -e .``）::
+
+    python benchmarks/bench_resample.py
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import scipy.signal
+import soundfile as sf
+
+from audiofeatures.core.audio_loader import RES_TYPES, _resample, load_audio
+
+ORIG_SR = 44100
+TARGET_SR = 16000
+REPEATS = 5
+
+
+def best_time(func):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for duration in (1, 30):
+            path = os.path.join(tmpdir, f"{duration}s.wav")
+            signal = 0.1 * rng.standard_normal(ORIG_SR * duration)
+            sf.write(path, signal.astype(np.float32), ORIG_SR, subtype="PCM_16")
+            native, _ = load_audio(path)
+
+            print(f"{duration} s clip, {ORIG_SR} Hz -> {TARGET_SR} Hz")
+            for res_type in RES_TYPES:
+                elapsed = best_time(lambda: load_audio(path, sr=TARGET_SR, res_type=res_type))
+                print(f"  {res_type:10s} {elapsed * 1e3:9.2f} ms  {duration / elapsed:9.0f}x realtime")
+
+            cached = best_time(lambda: _resample(native, ORIG_SR, TARGET_SR, "polyphase"))
+            uncached = best_time(lambda: scipy.signal.resample_poly(native, 160, 441))
+            print(
+                f"  polyphase resampling only: cached filter {cached * 1e3:.2f} ms | "
+                f"per-call design {uncached * 1e3:.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import soundfile as sf
+
+from audiofeatures.core import AudioCache, load_audio
+from audiofeatures.pipeline import FeatureExtractor
+
+
+class TestAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir_obj = tempfile.TemporaryDirectory()
+        self.temp_dir = self.temp_dir_obj.name
+        self.sr = 22050
+        rng = np.random.default_rng(0)
+        self.paths = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, f"clip{i}.wav")
+            sf.write(path, 0.1 * rng.standard_normal(self.sr), self.sr)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.temp_dir_obj.cleanup()
+
+    def test_memory_lru(self):
+        """测试内存层命中与按字节数淘汰"""
+        clip_bytes = 16000 * 4
+        cache = AudioCache(max_bytes=2 * clip_bytes)
+        first, sr = load_audio(self.paths[0], sr=16000, cache=cache)
+        again, _ = load_audio(self.paths[0], sr=16000, cache=cache)
+        self.assertIs(again, first)
+        self.assertEqual(sr, 16000)
+        self.assertFalse(first.flags.writeable)
+        np.testing.assert_array_equal(first, load_audio(self.paths[0], sr=16000)[0])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        load_audio(self.paths[1], sr=16000, cache=cache)
+        load_audio(self.paths[0], sr=16000, cache=cache)
+        load_audio(self.paths[2], sr=16000, cache=cache)
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+        load_audio(self.paths[0], sr=16000, cache=cache)
+        self.assertEqual(cache.hits, 3)
+
+        # 不同读取参数使用不同的键
+        load_audio(self.paths[0], sr=8000, cache=cache)
+        self.assertEqual(cache.misses, 4)
+
+    def test_disk_tier(self):
+        """测试磁盘层内存映射读回与文件修改后失效"""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        cache = AudioCache(max_bytes=0, cache_dir=cache_dir)
+        expected, _ = load_audio(self.paths[0], sr=16000, cache=cache)
+
+        restored = pickle.loads(pickle.dumps(cache))
+        audio, sr = load_audio(self.paths[0], sr=16000, cache=restored)
+        self.assertIsInstance(audio, np.memmap)
+        self.assertEqual(sr, 16000)
+        np.testing.assert_array_equal(audio, expected)
+        self.assertEqual(restored.hits, 1)
+
+        stat = os.stat(self.paths[0])
+        os.utime(self.paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        load_audio(self.paths[0], sr=16000, cache=restored)
+        self.assertEqual(restored.misses, 1)
+
+        cache.clear(disk=True)
+        self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_feature_extractor_cache(self):
+        """测试特征提取器复用解码缓存"""
+        cache = AudioCache()
+        extractor = FeatureExtractor(sr=16000, audio_cache=cache)
+        first = extractor.extract_from_file(self.paths[0], ["rms"])
+        second = extractor.extract_from_file(self.paths[0], ["rms"])
+        np.testing.assert_array_equal(first["rms"], second["rms"])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
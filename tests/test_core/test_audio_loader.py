@@ -2,10 +2,17 @@ import os
 import tempfile
 import unittest
 
+import librosa
 import numpy as np
 import soundfile as sf
 
-from audiofeatures.core.audio_loader import load_audio, get_audio_info
+from audiofeatures.core import audio_loader
+from audiofeatures.core.audio_loader import (
+    get_audio_info,
+    get_audio_info_many,
+    iter_audio_blocks,
+    load_audio
+)
 
 class TestAudioLoader(unittest.TestCase):
     def setUp(self):
@@ -33,6 +40,71 @@ class TestAudioLoader(unittest.TestCase):
         audio_16k, sr_16k = load_audio(self.wav_file, sr=16000)
         self.assertEqual(sr_16k, 16000)
 
+    def test_load_audio_mmap_matches_decoder(self):
+        """测试 WAV 内存映射路径与常规解码一致"""
+        rng = np.random.default_rng(0)
+        audio = (0.9 * (2.0 * rng.random((4000, 2)) - 1.0)).astype(np.float32)
+        for subtype in ["PCM_U8", "PCM_16", "PCM_24", "PCM_32", "FLOAT", "DOUBLE"]:
+            path = os.path.join(self.assets_dir, f"{subtype}.wav")
+            sf.write(path, audio, 8000, subtype=subtype)
+            for kwargs in [{}, {"mono": False}, {"offset": 0.1, "duration": 0.2}]:
+                fast, sr = load_audio(path, **kwargs)
+                slow, _ = load_audio(path, mmap=False, **kwargs)
+                self.assertEqual(sr, 8000)
+                self.assertEqual(fast.dtype, np.float32)
+                np.testing.assert_array_equal(fast, slow)
+
+        float_path = os.path.join(self.assets_dir, "mono_float.wav")
+        sf.write(float_path, audio[:, 0], self.src_sr, subtype="FLOAT")
+        view, _ = load_audio(float_path, offset=0.1, duration=0.05)
+        self.assertFalse(view.flags.writeable)
+        self.assertEqual(view.shape, (int(0.05 * self.src_sr),))
+
+        # 多声道 float32 WAV 在 mono=False 时同样返回只读视图
+        stereo, _ = load_audio(os.path.join(self.assets_dir, "FLOAT.wav"), mono=False)
+        self.assertEqual(stereo.shape, (2, 4000))
+        self.assertFalse(stereo.flags.writeable)
+        # 需要写入的路径（如下混为单声道）返回新数组
+        downmixed, _ = load_audio(os.path.join(self.assets_dir, "FLOAT.wav"))
+        self.assertTrue(downmixed.flags.writeable)
+
+    def test_load_audio_res_type(self):
+        """测试重采样方法选择与多相滤波器缓存"""
+        reference, _ = librosa.load(self.wav_file, sr=None)
+        for res_type in ["soxr_qq", "polyphase"]:
+            audio, sr = load_audio(self.wav_file, sr=16000, res_type=res_type)
+            expected = librosa.resample(
+                reference, orig_sr=self.src_sr, target_sr=16000, res_type=res_type
+            )
+            self.assertEqual(sr, 16000)
+            np.testing.assert_array_equal(audio, expected)
+
+        audio_loader._polyphase_filter.cache_clear()
+        load_audio(self.wav_file, sr=16000, res_type="polyphase")
+        load_audio(self.wav_file, sr=16000, res_type="polyphase")
+        self.assertEqual(audio_loader._polyphase_filter.cache_info().hits, 1)
+
+        with self.assertRaises(ValueError):
+            load_audio(self.wav_file, sr=16000, res_type="kaiser_best")
+
+    def test_iter_audio_blocks_matches_load_audio(self):
+        """测试流式分块读取（含重采样）与整段读取一致"""
+        rng = np.random.default_rng(1)
+        path = os.path.join(self.assets_dir, "stereo.wav")
+        sf.write(path, 0.3 * rng.standard_normal((5000, 2)), self.src_sr, subtype="FLOAT")
+        for sr, mono in [(None, True), (16000, True), (16000, False)]:
+            blocks = list(iter_audio_blocks(path, block_size=700, overlap=100, sr=sr, mono=mono))
+            self.assertTrue(all(block.shape[-1] == 700 for block in blocks[:-1]))
+            for previous, block in zip(blocks, blocks[1:]):
+                np.testing.assert_array_equal(previous[..., -100:], block[..., :100])
+            joined = np.concatenate([blocks[0]] + [block[..., 100:] for block in blocks[1:]], axis=-1)
+            expected, _ = load_audio(path, sr=sr, mono=mono)
+            self.assertEqual(joined.dtype, np.float32)
+            np.testing.assert_allclose(joined, expected, atol=1e-6)
+
+        with self.assertRaises(ValueError):
+            next(iter_audio_blocks(path, block_size=100, overlap=100))
+
     def test_get_audio_info(self):
         """测试获取音频信息"""
         # wav 文件
@@ -43,6 +115,37 @@ class TestAudioLoader(unittest.TestCase):
         self.assertEqual(wav_info["channels"], 1)
         self.assertGreater(wav_info["duration"], 0)
 
+    @unittest.skipUnless("MP3" in sf.available_formats(), "libsndfile without MP3 support")
+    def test_get_audio_info_mp3_header(self):
+        """测试 MP3 头部解析与解码样本数一致"""
+        rng = np.random.default_rng(0)
+        for sr, channels in [(44100, 2), (16000, 1)]:
+            path = os.path.join(self.assets_dir, f"test_{sr}.mp3")
+            sf.write(path, 0.1 * rng.standard_normal((int(1.3 * sr), channels)), sr)
+            info = get_audio_info(path)
+            decoded = sf.read(path)[0]
+            self.assertEqual(info["format"], "mp3")
+            self.assertEqual(info["sr"], sr)
+            self.assertEqual(info["channels"], channels)
+            self.assertEqual(info["samples"], decoded.shape[0])
+            self.assertIsNone(info["bit_depth"])
+
+        # 带 ID3v2 标签
+        tagged = os.path.join(self.assets_dir, "tagged.mp3")
+        with open(path, "rb") as src, open(tagged, "wb") as dst:
+            dst.write(b"ID3\x03\x00\x00\x00\x00\x00\x20" + b"\x00" * 32 + src.read())
+        self.assertEqual(get_audio_info(tagged)["samples"], info["samples"])
+
+    def test_get_audio_info_many(self):
+        """测试批量获取音频信息"""
+        missing = os.path.join(self.assets_dir, "missing.wav")
+        infos = get_audio_info_many([self.wav_file, missing, self.wav_file], n_workers=2)
+        self.assertEqual(len(infos), 3)
+        self.assertEqual(infos[0]["sr"], self.src_sr)
+        self.assertIsInstance(infos[1], Exception)
+        self.assertEqual(infos[2], infos[0])
+        self.assertEqual(get_audio_info_many([self.wav_file], n_workers=1), infos[:1])
+
     def test_error_handling(self):
         """测试错误处理"""
         non_exist_file = os.path.join(self.assets_dir, "non_exist_file.wav")
@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from audiofeatures.core.signal_processing import frame_signal, apply_window
+from audiofeatures.core.signal_processing import frame_signal, frame_energy, frame_autocorrelation, apply_window
 
 class TestSignalProcessing(unittest.TestCase):
     def setUp(self):
@@ -43,6 +43,23 @@ class TestSignalProcessing(unittest.TestCase):
             expected_frames = (padded_length - self.frame_length) // self.hop_length + 1
             self.assertEqual(frames.shape, (expected_frames, self.frame_length))
 
+    def test_frame_signal_view(self):
+        """测试分帧默认返回只读视图"""
+        signal = self.test_signal.astype(np.float32)
+        frames = frame_signal(signal, self.frame_length, self.hop_length, center=False)
+        expected = np.stack([
+            signal[start:start + self.frame_length]
+            for start in range(0, len(signal) - self.frame_length + 1, self.hop_length)
+        ])
+        np.testing.assert_array_equal(frames, expected)
+        self.assertTrue(np.shares_memory(frames, signal))
+        self.assertFalse(frames.flags.writeable)
+
+        copied = frame_signal(signal, self.frame_length, self.hop_length, center=False, copy=True)
+        np.testing.assert_array_equal(copied, expected)
+        self.assertFalse(np.shares_memory(copied, signal))
+        self.assertTrue(copied.flags.writeable)
+
     def test_frame_signal_error(self):
         """测试信号分帧错误处理"""
         # 测试多维数组输入
@@ -50,6 +67,33 @@ class TestSignalProcessing(unittest.TestCase):
         with self.assertRaises(ValueError):
             frame_signal(invalid_signal, self.frame_length, self.hop_length)
 
+    def test_frame_autocorrelation(self):
+        """测试批量自相关与逐帧 np.correlate 一致"""
+        frames = frame_signal(self.test_signal, self.frame_length, self.hop_length, copy=True)
+        corr = frame_autocorrelation(frames.astype(np.float64), max_lag=10)
+        self.assertEqual(corr.shape, (frames.shape[0], 11))
+        for frame, row in zip(frames.astype(np.float64), corr):
+            expected = np.correlate(frame, frame, mode="full")[self.frame_length - 1:][:11]
+            np.testing.assert_allclose(row, expected, atol=1e-10)
+        with self.assertRaises(ValueError):
+            frame_autocorrelation(frames, max_lag=self.frame_length)
+
+    def test_frame_energy(self):
+        """测试累积和帧能量与逐帧平方和一致"""
+        rng = np.random.default_rng(0)
+        signal = (rng.standard_normal(5000) * 30).astype(np.float32)
+        signal[2000:3500] = 0.0
+        for frame_length, hop_length in [(25, 10), (400, 160), (2048, 512), (7, 3), (1, 1)]:
+            for center in (True, False):
+                frames = frame_signal(signal, frame_length, hop_length, center=center)
+                expected = np.sum(frames.astype(np.float64) ** 2, axis=1)
+                values = frame_energy(signal, frame_length, hop_length, center=center)
+                self.assertEqual(values.shape, expected.shape)
+                np.testing.assert_allclose(values, expected, rtol=1e-7)
+                # 静音区域内的帧严格为 0
+                np.testing.assert_array_equal(values == 0, expected == 0)
+        self.assertEqual(frame_energy(signal[:3], 25, 10, center=False).shape, (0,))
+
     def test_apply_window(self):
         """测试窗函数应用"""
         frames = frame_signal(
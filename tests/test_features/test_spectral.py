@@ -1,7 +1,9 @@
 import unittest
 import numpy as np
+from scipy import linalg
+from scipy import signal as sci_signal
 
-from audiofeatures.features import mfcc, delta_mfcc, mel_spectrogram
+from audiofeatures.features import mfcc, delta_mfcc, mel_spectrogram, formant_frequencies
 
 
 class TestSpectralFeatures(unittest.TestCase):
@@ -22,6 +24,41 @@ class TestSpectralFeatures(unittest.TestCase):
         self.assertEqual(mel.shape[1], 40)
         self.assertGreater(mel.shape[0], 0)
 
+    def test_formant_frequencies(self):
+        pulses = np.zeros(self.sr)
+        pulses[::self.sr // 120] = 1.0
+        voiced = pulses
+        for freq, bandwidth in [(700, 80), (1220, 90), (2600, 120)]:
+            radius = np.exp(-np.pi * bandwidth / self.sr)
+            theta = 2 * np.pi * freq / self.sr
+            voiced = sci_signal.lfilter([1.0], [1.0, -2 * radius * np.cos(theta), radius ** 2], voiced)
+        voiced = voiced / np.max(np.abs(voiced))
+        voiced[:3000] = 0.0
+
+        formants = formant_frequencies(voiced, sr=self.sr, order=12, n_formants=4)
+        self.assertEqual(formants.shape[1], 4)
+        self.assertTrue(np.all(formants[:17] == 0))
+        np.testing.assert_allclose(np.median(formants[40:-5, :3], axis=0), [700, 1220, 2600], rtol=0.05)
+
+    def test_formant_frequencies_matches_framewise_lpc(self):
+        rng = np.random.default_rng(0)
+        noisy = rng.standard_normal(self.sr // 4).astype(np.float32)
+        order, frame_length, hop_length = 10, int(0.03 * self.sr), int(0.01 * self.sr)
+        formants = formant_frequencies(noisy, sr=self.sr, order=order, n_formants=3)
+
+        padded = np.pad(noisy, frame_length // 2).astype(np.float64)
+        window = np.hamming(frame_length)
+        for i in range(formants.shape[0]):
+            frame = padded[i * hop_length:i * hop_length + frame_length]
+            frame = (frame - frame.mean()) * window
+            corr = np.correlate(frame, frame, mode="full")[frame_length - 1:frame_length + order]
+            coeffs = np.concatenate(([1.0], linalg.solve_toeplitz(corr[:-1], -corr[1:])))
+            roots = np.roots(coeffs)
+            roots = roots[roots.imag >= 0]
+            freqs = np.arctan2(roots.imag, roots.real) * self.sr / (2 * np.pi)
+            freqs = np.sort(freqs[(freqs > 0) & (freqs < self.sr / 2)])[:3]
+            np.testing.assert_allclose(formants[i, :freqs.size], freqs, rtol=1e-4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,6 +30,50 @@ class TestTimeDomainFeatures(unittest.TestCase):
         self.assertTrue(voiced.size > 0)
         self.assertTrue(np.abs(np.median(voiced) - 440) < 30)
 
+    def test_pitch_yin(self):
+        sr = 16000
+        t = np.arange(sr) / sr
+        signal = np.sin(2 * np.pi * 110 * t) + 0.5 * np.sin(2 * np.pi * 220 * t)
+        signal[6000:10000] = 0.0
+        p, confidence = pitch(
+            signal, sr=sr, frame_length=1024, hop_length=256, method="yin", return_confidence=True
+        )
+        self.assertEqual(p.shape, confidence.shape)
+        self.assertEqual(p.shape[1], 1)
+        voiced = p[:, 0] > 0
+        self.assertGreater(np.mean(voiced), 0.5)
+        np.testing.assert_allclose(p[voiced, 0], 110.0, atol=1.0)
+        self.assertTrue(np.all(confidence[voiced] > 0.9))
+        silent = (np.arange(p.shape[0]) * 256 >= 6000) & (np.arange(p.shape[0]) * 256 + 1024 <= 10000)
+        self.assertTrue(np.all(p[silent] == 0))
+        self.assertTrue(np.all(confidence[silent] == 0))
+        with self.assertRaises(ValueError):
+            pitch(signal, sr=sr, method="yin", threshold=1.5)
+
+    def test_pitch_matches_framewise_autocorrelation(self):
+        sr = 16000
+        rng = np.random.default_rng(0)
+        t = np.arange(sr) / sr
+        signal = np.sin(2 * np.pi * 220 * t) + 0.05 * rng.standard_normal(sr)
+        signal[4000:6000] = 0.0
+        signal = signal.astype(np.float32)
+        frame_length, hop_length = 1024, 512
+        min_lag, max_lag = int(sr / 2000.0), int(sr / 50.0)
+        for method in ("autocorr", "improved_autocorr"):
+            expected = []
+            for start in range(0, sr - frame_length + 1, hop_length):
+                frame = signal[start:start + frame_length]
+                frame = frame - np.mean(frame)
+                if method == "improved_autocorr":
+                    frame = frame * np.hanning(frame_length)
+                if np.allclose(frame, 0.0):
+                    expected.append(0.0)
+                    continue
+                corr = np.correlate(frame, frame, mode="full")[frame_length - 1:]
+                expected.append(sr / (min_lag + np.argmax(corr[min_lag:max_lag])))
+            p = pitch(signal, sr=sr, frame_length=frame_length, hop_length=hop_length, method=method)
+            np.testing.assert_allclose(p[:, 0], expected, rtol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,41 @@
+import os
+import tempfile
+import time
 import unittest
+
 import numpy as np
+import soundfile as sf
+from scipy import stats
+
+from audiofeatures.features import mfcc, spectral_bandwidth, spectral_centroid, spectral_rolloff
+from audiofeatures.pipeline import (
+    FeatureAggregator,
+    FeatureCache,
+    FeatureExtractor,
+    SpectralContext,
+    StreamingAggregator
+)
+
+
+class _UnpicklableError(Exception):
+    def __init__(self):
+        super().__init__("unpicklable")
+        self.callback = lambda: None
+
 
-from audiofeatures.pipeline import FeatureExtractor, FeatureAggregator
+class _FailingExtractor(FeatureExtractor):
+    """按文件名前缀模拟工作进程中的故障：``crash`` 终止进程，``unpicklable``
+    抛出不可序列化异常，``slow`` 延迟返回。"""
+
+    def extract_from_file(self, file_path, feature_types):
+        name = os.path.basename(file_path)
+        if name.startswith("crash"):
+            os._exit(1)
+        if name.startswith("unpicklable"):
+            raise _UnpicklableError()
+        if name.startswith("slow"):
+            time.sleep(0.1)
+        return super().extract_from_file(file_path, feature_types)
 
 
 class TestPipeline(unittest.TestCase):
@@ -20,6 +54,154 @@ class TestPipeline(unittest.TestCase):
         self.assertEqual(features["spectral_centroid"].ndim, 2)
         self.assertEqual(features["zcr"].ndim, 2)
 
+    def test_shared_spectral_context_matches_standalone(self):
+        extractor = FeatureExtractor(sr=self.sr, n_fft=512, hop_length=256, n_mels=40)
+        features = extractor.extract_features(
+            self.signal,
+            ["mfcc", "spectral_centroid", "spectral_bandwidth", "spectral_rolloff"]
+        )
+        kwargs = {"sr": self.sr, "n_fft": 512, "hop_length": 256}
+        np.testing.assert_allclose(
+            features["mfcc"],
+            mfcc(self.signal, n_mfcc=13, n_mels=40, **kwargs),
+            rtol=1e-5,
+            atol=1e-4
+        )
+        np.testing.assert_allclose(
+            features["spectral_centroid"], spectral_centroid(self.signal, **kwargs), rtol=1e-5
+        )
+        np.testing.assert_allclose(
+            features["spectral_bandwidth"], spectral_bandwidth(self.signal, **kwargs), rtol=1e-5
+        )
+        np.testing.assert_allclose(
+            features["spectral_rolloff"], spectral_rolloff(self.signal, **kwargs), rtol=1e-5
+        )
+
+    def test_spectral_context_caches_intermediates(self):
+        context = SpectralContext(self.signal.astype(np.float32), sr=self.sr, n_fft=512, hop_length=256)
+        self.assertIs(context.stft, context.stft)
+        self.assertIs(context.power, context.power)
+        self.assertEqual(context.mel.shape, (128, context.stft.shape[1]))
+
+    def test_plan_shares_intermediates(self):
+        extractor = FeatureExtractor(sr=self.sr)
+        plan = extractor.plan(["chroma", "mfcc", "tonnetz", "mfcc"])
+        self.assertEqual(plan.features, ("chroma", "mfcc", "tonnetz"))
+        self.assertEqual(plan.intermediates.count("stft"), 1)
+        self.assertLess(plan.intermediates.index("stft"), plan.intermediates.index("harmonic"))
+        self.assertLess(plan.intermediates.index("mel"), plan.intermediates.index("log_mel"))
+        self.assertEqual(extractor.plan(["zcr", "rms"]).intermediates, ())
+        with self.assertRaises(ValueError):
+            extractor.plan(["unknown"])
+
+    def test_extract_from_files(self):
+        extractor = FeatureExtractor(sr=self.sr, n_fft=512, hop_length=256)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for i in range(3):
+                path = os.path.join(tmpdir, f"clip_{i}.wav")
+                sf.write(path, self.signal * (i + 1) / 4.0, self.sr)
+                paths.append(path)
+            missing = os.path.join(tmpdir, "missing.wav")
+
+            for n_workers in (1, 2):
+                results = dict(extractor.extract_from_files(
+                    paths + [missing], ["mfcc", "zcr"], n_workers=n_workers, chunksize=2
+                ))
+                self.assertEqual(set(results), set(paths + [missing]))
+                self.assertIsInstance(results[missing], Exception)
+                expected = extractor.extract_from_file(paths[1], ["mfcc", "zcr"])
+                np.testing.assert_array_equal(results[paths[1]]["mfcc"], expected["mfcc"])
+                np.testing.assert_array_equal(results[paths[1]]["zcr"], expected["zcr"])
+
+        with self.assertRaises(ValueError):
+            extractor.extract_from_files(paths, ["unknown"])
+        with self.assertRaises(ValueError):
+            extractor.extract_from_files(paths, ["mfcc"], n_workers=0)
+        with self.assertRaises(ValueError):
+            extractor.extract_from_files(paths, ["mfcc"], chunksize=0)
+
+    def test_extract_from_files_isolates_failed_chunks(self):
+        extractor = _FailingExtractor(sr=self.sr, n_fft=512, hop_length=256)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            def write(names):
+                paths = [os.path.join(tmpdir, name) for name in names]
+                for path in paths:
+                    sf.write(path, self.signal, self.sr)
+                return paths
+
+            # 不可序列化的异常使整个任务（chunk）的结果无法回传
+            paths = write(["ok_0.wav", "unpicklable.wav", "ok_1.wav", "ok_2.wav"])
+            results = dict(extractor.extract_from_files(paths, ["zcr"], n_workers=2, chunksize=2))
+            self.assertEqual(set(results), set(paths))
+            self.assertIsInstance(results[paths[0]], Exception)
+            self.assertIsInstance(results[paths[1]], Exception)
+            self.assertIn("zcr", results[paths[2]])
+            self.assertIn("zcr", results[paths[3]])
+
+            # 进程崩溃后新建进程池，后续文件照常处理
+            paths = write(["crash.wav"] + [f"slow_{i}.wav" for i in range(12)])
+            results = dict(extractor.extract_from_files(paths, ["zcr"], n_workers=2))
+            self.assertEqual(set(results), set(paths))
+            self.assertIsInstance(results[paths[0]], Exception)
+            self.assertIn("zcr", results[paths[-1]])
+
+    def test_feature_cache_computes_only_missing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "clip.wav")
+            sf.write(path, self.signal, self.sr)
+            cache = FeatureCache(os.path.join(tmpdir, "features"))
+            extractor = FeatureExtractor(sr=self.sr, feature_cache=cache)
+            requested = []
+            extract_features = extractor.extract_features
+
+            def recording(signal, feature_types):
+                requested.append(list(feature_types))
+                return extract_features(signal, feature_types)
+
+            extractor.extract_features = recording
+            first = extractor.extract_from_file(path, ["mfcc", "rms"])
+            second = extractor.extract_from_file(path, ["mfcc", "rms", "zcr"])
+            self.assertEqual(requested, [["mfcc", "rms"], ["zcr"]])
+            self.assertEqual(list(second), ["mfcc", "rms", "zcr"])
+            self.assertIsInstance(second["mfcc"], np.memmap)
+            np.testing.assert_array_equal(second["mfcc"], first["mfcc"])
+
+            # 配置变化时键不同，需要重新计算
+            other = FeatureExtractor(sr=self.sr, n_mfcc=20, feature_cache=cache)
+            self.assertEqual(other.extract_from_file(path, ["mfcc"])["mfcc"].shape[1], 20)
+            self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_extract_stream_matches_offline(self):
+        feature_types = [
+            "mfcc", "spectral_centroid", "spectral_bandwidth", "spectral_rolloff", "zcr", "rms"
+        ]
+        rng = np.random.default_rng(0)
+        signal = (0.1 * rng.standard_normal(2 * self.sr)).astype(np.float32)
+        signal[self.sr // 2:self.sr] = 0.0
+        extractor = FeatureExtractor(sr=self.sr, n_fft=400, hop_length=160)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "long.wav")
+            sf.write(path, signal, self.sr, subtype="FLOAT")
+            offline = extractor.extract_from_file(path, feature_types)
+            chunks = list(extractor.extract_stream(path, feature_types, block_size=777))
+
+            self.assertGreater(len(chunks), 1)
+            for name in feature_types:
+                streamed = np.concatenate([chunk[name] for chunk in chunks])
+                self.assertEqual(streamed.shape, offline[name].shape)
+                np.testing.assert_allclose(streamed, offline[name], rtol=1e-5, atol=1e-4)
+
+            with self.assertRaises(ValueError):
+                list(extractor.extract_stream(path, ["chroma"]))
+
+            resampling = FeatureExtractor(sr=8000, n_fft=256, hop_length=80)
+            offline = resampling.extract_from_file(path, ["rms", "zcr"])
+            chunks = list(resampling.extract_stream(path, ["rms", "zcr"], block_size=1000))
+            for name in ["rms", "zcr"]:
+                streamed = np.concatenate([chunk[name] for chunk in chunks])
+                np.testing.assert_allclose(streamed, offline[name], rtol=1e-5, atol=1e-6)
+
     def test_feature_aggregator(self):
         features = {
             "mfcc": np.random.randn(10, 13),
@@ -36,6 +218,81 @@ class TestPipeline(unittest.TestCase):
         self.assertIn("mfcc", stats)
         self.assertIn("mean", stats["mfcc"])
 
+    def test_feature_aggregator_matches_reference_statistics(self):
+        rng = np.random.default_rng(0)
+        features = {
+            "mfcc": rng.standard_normal((101, 13)),
+            "zcr": rng.random((10, 1)).astype(np.float32),
+            "constant": np.ones((5, 2))
+        }
+        methods = [
+            "mean", "std", "min", "max", "median", "skewness", "kurtosis", "range",
+            "quantile_25", "quantile_75", "quantile_90"
+        ]
+        aggregated = FeatureAggregator().aggregate_features(features, methods)
+        for name, values in features.items():
+            expected = {
+                "mean": np.mean(values, axis=0),
+                "std": np.std(values, axis=0),
+                "min": np.min(values, axis=0),
+                "max": np.max(values, axis=0),
+                "median": np.median(values, axis=0),
+                "skewness": stats.skew(values.astype(np.float64), axis=0, bias=False),
+                "kurtosis": stats.kurtosis(values.astype(np.float64), axis=0, bias=False),
+                "range": np.ptp(values, axis=0),
+                "quantile_25": np.quantile(values, 0.25, axis=0),
+                "quantile_75": np.quantile(values, 0.75, axis=0),
+                "quantile_90": np.quantile(values, 0.90, axis=0)
+            }
+            for method, value in expected.items():
+                result = aggregated[f"{name}_{method}"]
+                self.assertEqual(result.dtype, np.float32)
+                np.testing.assert_allclose(result, value, rtol=1e-5, atol=1e-6, equal_nan=True)
+
+        with self.assertRaises(ValueError):
+            FeatureAggregator().aggregate_features(features, ["quantile_x"])
+
+    def test_streaming_aggregator_matches_batch(self):
+        rng = np.random.default_rng(1)
+        features = {
+            "mfcc": rng.standard_normal((5000, 13)) * 3.0 + 10.0,
+            "zcr": rng.exponential(size=5000)
+        }
+        methods = [
+            "mean", "std", "min", "max", "skewness", "kurtosis", "range",
+            "median", "quantile_25", "quantile_90"
+        ]
+        expected = FeatureAggregator().aggregate_features(features, methods)
+
+        left = StreamingAggregator(sketch_size=256)
+        right = StreamingAggregator(sketch_size=256)
+        for index, rows in enumerate(np.array_split(np.arange(5000), 17)):
+            chunk = {name: values[rows] for name, values in features.items()}
+            (left if index % 2 else right).update(chunk)
+        result = left.merge(right).finalize(methods)
+
+        for key, value in expected.items():
+            self.assertEqual(result[key].dtype, np.float32)
+            self.assertEqual(result[key].shape, value.shape)
+            if key.endswith(("median", "quantile_25", "quantile_90")):
+                np.testing.assert_allclose(result[key], value, atol=0.3)
+            else:
+                np.testing.assert_allclose(result[key], value, rtol=1e-5, atol=1e-5)
+
+        small = StreamingAggregator()
+        small.update({"mfcc": features["mfcc"][:100]})
+        small.update({"mfcc": features["mfcc"][100:300]})
+        reference = FeatureAggregator().aggregate_features(
+            {"mfcc": features["mfcc"][:300]}, ["median", "quantile_75"]
+        )
+        for key, value in small.finalize(["median", "quantile_75"]).items():
+            np.testing.assert_allclose(value, reference[key], rtol=1e-6)
+
+        with self.assertRaises(ValueError):
+            small.update({"mfcc": np.zeros((4, 2))})
+        with self.assertRaises(ValueError):
+            small.finalize(["mode"])
+
 
 if __name__ == "__main__":
     unittest.main()
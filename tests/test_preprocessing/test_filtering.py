@@ -1,5 +1,6 @@
 import unittest
 import numpy as np
+from scipy import signal as sci_signal
 import audiofeatures.preprocessing as prep
 
 class TestFiltering(unittest.TestCase):
@@ -24,6 +25,86 @@ class TestFiltering(unittest.TestCase):
         filtered = prep.band_pass_filter(self.signal, self.sr, 500, 2000)
         self.assertEqual(len(filtered), len(self.signal))
         
+    def test_zero_phase_matches_sosfiltfilt(self):
+        # 缓存设计与 sosfiltfilt 结果一致，高阶窄带也保持稳定
+        signal = self.signal.astype(np.float32)
+        sos = sci_signal.butter(8, (60, 120), btype="band", fs=self.sr, output="sos")
+        expected = sci_signal.sosfiltfilt(sos, signal).astype(np.float32)
+        for _ in range(2):
+            filtered = prep.band_pass_filter(signal, self.sr, 60, 120, order=8)
+            np.testing.assert_array_equal(filtered, expected)
+        self.assertTrue(np.all(np.isfinite(filtered)))
+        with self.assertRaises(ValueError):
+            prep.low_pass_filter(signal, self.sr, cutoff_freq=8000)
+
+    def test_zero_phase_matches_sosfiltfilt_edge_lengths(self):
+        # 奇数阶、各类型与 padlen 附近的长度均与 sosfiltfilt 一致（含报错边界）
+        rng = np.random.default_rng(1)
+        cases = [
+            (prep.low_pass_filter, (1000,), 1000, "low"),
+            (prep.high_pass_filter, (1000,), 1000, "high"),
+            (prep.band_pass_filter, (300, 3000), (300, 3000), "band")
+        ]
+        for func, args, cutoff, btype in cases:
+            for order in [1, 2, 3, 5, 7]:
+                sos = sci_signal.butter(order, cutoff, btype=btype, fs=self.sr, output="sos")
+                # sosfiltfilt 能处理的最短长度为 padlen + 1
+                length = 1
+                while True:
+                    try:
+                        sci_signal.sosfiltfilt(sos, np.zeros(length))
+                        break
+                    except ValueError:
+                        length += 1
+                padlen = length - 1
+                with self.assertRaises(ValueError):
+                    func(rng.standard_normal(padlen).astype(np.float32), self.sr, *args, order=order)
+                for n in [padlen + 1, padlen + 2, 500]:
+                    signal = rng.standard_normal((2, n)).astype(np.float32)
+                    expected = sci_signal.sosfiltfilt(sos, signal).astype(np.float32)
+                    np.testing.assert_array_equal(func(signal, self.sr, *args, order=order), expected)
+                    np.testing.assert_array_equal(
+                        func(signal.T, self.sr, *args, order=order, axis=0), expected.T
+                    )
+
+    def test_streaming_filter(self):
+        # 分块滤波拼接后与整段因果滤波一致
+        rng = np.random.default_rng(0)
+        signal = rng.standard_normal(self.sr).astype(np.float32)
+        filt = prep.StreamingFilter(self.sr, (300, 3000), btype="band", order=6)
+        expected = sci_signal.sosfilt(filt.sos, signal).astype(np.float32)
+        bounds = np.concatenate(([0], np.sort(rng.integers(0, len(signal), 20)), [len(signal)]))
+        blocks = [filt.process(signal[start:stop]) for start, stop in zip(bounds[:-1], bounds[1:])]
+        np.testing.assert_array_equal(np.concatenate(blocks), expected)
+
+        filt.reset()
+        np.testing.assert_array_equal(filt.process(signal), expected)
+        for cutoff, btype in [(1000, "notch"), (1000, "band"), ((300, 3000, 5000), "band"),
+                              ((300, 3000), "low")]:
+            with self.assertRaises(ValueError):
+                prep.StreamingFilter(self.sr, cutoff, btype=btype)
+
+    def test_batched_filtering(self):
+        # 多维输入沿指定轴一次滤波，与逐条处理一致
+        rng = np.random.default_rng(0)
+        batch = rng.standard_normal((4, 2000)).astype(np.float32)
+        filtered = prep.band_pass_filter(batch, self.sr, 300, 3000)
+        expected = np.stack([prep.band_pass_filter(clip, self.sr, 300, 3000) for clip in batch])
+        np.testing.assert_array_equal(filtered, expected)
+        np.testing.assert_array_equal(prep.low_pass_filter(batch.T, self.sr, 1000, axis=0).T,
+                                      prep.low_pass_filter(batch, self.sr, 1000))
+
+        medians = prep.median_filter(batch.T, kernel_size=5, axis=0)
+        expected = np.stack([prep.median_filter(clip, kernel_size=5) for clip in batch])
+        np.testing.assert_array_equal(medians.T, expected)
+
+        filt = prep.StreamingFilter(self.sr, 1000)
+        blocks = [filt.process(batch[:, start:start + 300]) for start in range(0, 2000, 300)]
+        expected = sci_signal.sosfilt(filt.sos, batch, axis=-1).astype(np.float32)
+        np.testing.assert_array_equal(np.concatenate(blocks, axis=1), expected)
+        with self.assertRaises(ValueError):
+            filt.process(batch[:2, :300])
+
     def test_median_filter(self):
         # 测试中值滤波器去除脉冲噪声
         noisy_signal = self.signal.copy()
@@ -31,5 +112,20 @@ class TestFiltering(unittest.TestCase):
         filtered = prep.median_filter(noisy_signal, kernel_size=3)
         self.assertTrue(np.abs(filtered[100]) < 10)
 
+    def test_median_filter_matches_medfilt(self):
+        # 各核大小（比较网络与滑动中值两种实现）均与 medfilt 的补零结果一致
+        rng = np.random.default_rng(0)
+        batch = rng.standard_normal((3, 500)).astype(np.float32)
+        batch[:, ::9] = 0.0
+        for kernel_size in [1, 3, 5, 7, 101, 301]:
+            expected = sci_signal.medfilt(batch, [1, kernel_size])
+            np.testing.assert_array_equal(prep.median_filter(batch, kernel_size), expected)
+            np.testing.assert_array_equal(prep.median_filter(batch[0], kernel_size), expected[0])
+        with_nan = batch[0].copy()
+        with_nan[10] = np.nan
+        np.testing.assert_array_equal(
+            prep.median_filter(with_nan, 3), sci_signal.medfilt(with_nan, 3)
+        )
+
 if __name__ == '__main__':
     unittest.main()
@@ -29,6 +29,33 @@ class TestSegmentation(unittest.TestCase):
         self.assertTrue(len(segments) > 0)
         self.assertTrue(all(isinstance(seg, tuple) for seg in segments))
         
+    def test_segment_by_energy_matches_sample_scan(self):
+        # 向量化结果与逐样本扫描一致
+        rng = np.random.default_rng(0)
+        signal = (rng.standard_normal(20000) * (rng.random(20000) > 0.3)).astype(np.float32)
+        for threshold, min_length in [(0.0, 0.0), (0.05, 0.0), (0.01, 0.0002)]:
+            norm_energy = signal ** 2 / np.max(signal ** 2)
+            indices = np.where(norm_energy > threshold)[0]
+            expected = []
+            start = indices[0]
+            for previous, current in zip(indices[:-1], indices[1:]):
+                if current - previous > 1:
+                    if (previous - start) / self.sr >= min_length:
+                        expected.append((start, previous))
+                    start = current
+            if (indices[-1] - start) / self.sr >= min_length:
+                expected.append((start, indices[-1]))
+            segments = prep.segment_by_energy(signal, self.sr, threshold, min_length)
+            self.assertEqual(segments, expected)
+
+    def test_segment_by_energy_frame_mode(self):
+        segments = prep.segment_by_energy(
+            self.signal, self.sr, threshold=0.1, min_length=0.05, hop_length=0.005
+        )
+        self.assertEqual(segments, [(4000, 5999), (8000, 9999)])
+        with self.assertRaises(ValueError):
+            prep.segment_by_energy(self.signal, self.sr, frame_length=0.01)
+
     def test_segment_by_zcr(self):
         # 测试基于过零率的分割
         segments = prep.segment_by_zcr(
@@ -39,5 +66,23 @@ class TestSegmentation(unittest.TestCase):
         self.assertTrue(len(segments) > 0)
         self.assertTrue(all(isinstance(seg, tuple) for seg in segments))
 
+    def test_segment_by_zcr_matches_frame_loop(self):
+        # 向量化结果与逐帧计算一致
+        rng = np.random.default_rng(0)
+        signal = np.where(rng.random(16000) > 0.5, rng.standard_normal(16000), self.signal)
+        signal = signal.astype(np.float32)
+        frame, hop = 400, 160
+        zcr = np.array([
+            np.sum(np.abs(np.diff(np.signbit(signal[i:i + frame]).astype(int)))) / (frame - 1)
+            for i in range(0, len(signal) - frame, hop)
+        ])
+        for threshold in [0.05, 0.3]:
+            segments = prep.segment_by_zcr(signal, self.sr, threshold=threshold, min_length=0.0)
+            covered = np.zeros(len(zcr), dtype=bool)
+            for start, end in segments:
+                self.assertIsInstance(start, int)
+                covered[start // hop:(end - frame) // hop] = True
+            np.testing.assert_array_equal(covered, zcr > threshold)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from audiofeatures.utils import FeatureStore
+
+
+class TestFeatureStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir_obj = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.temp_dir_obj.name, "store")
+        rng = np.random.default_rng(0)
+        self.clips = {
+            f"clip-{i}": {
+                "mfcc": rng.standard_normal((20 + i, 13)).astype(np.float32),
+                "rms": rng.random(20 + i).astype(np.float32)
+            }
+            for i in range(6)
+        }
+
+    def tearDown(self):
+        self.temp_dir_obj.cleanup()
+
+    def test_write_and_lazy_read(self):
+        store = FeatureStore(self.root)
+        clip_ids = list(self.clips)
+        # 两个写入者模拟并行写入，其中一个使用压缩编码并频繁切换分片
+        with store.writer(writer_id="a", shard_bytes=2048) as writer:
+            for clip_id in clip_ids[:3]:
+                writer.append(clip_id, self.clips[clip_id])
+        with store.writer(writer_id="b", codec="zlib") as writer:
+            for clip_id in clip_ids[3:]:
+                writer.append(clip_id, self.clips[clip_id])
+
+        self.assertEqual(len(store), 0)
+        store.refresh()
+        self.assertEqual(sorted(store), sorted(clip_ids))
+        self.assertGreater(len({store.info(c)["shard"] for c in clip_ids[:3]}), 1)
+
+        for clip_id, features in self.clips.items():
+            loaded = store[clip_id]
+            np.testing.assert_array_equal(loaded["mfcc"], features["mfcc"])
+            np.testing.assert_array_equal(loaded["rms"], features["rms"].reshape(-1, 1))
+            self.assertEqual(loaded["mfcc"].dtype, np.float32)
+
+        lazy = store.get("clip-0", keys=["mfcc"])
+        self.assertEqual(list(lazy), ["mfcc"])
+        self.assertIsInstance(lazy["mfcc"], np.memmap)
+        self.assertFalse(lazy["mfcc"].flags.writeable)
+
+        # 重新打开同一写入者时追加到新分片
+        with store.writer(writer_id="a") as writer:
+            writer.append("clip-extra", {"rms": np.ones(3)})
+        reopened = FeatureStore(self.root)
+        self.assertIn("clip-extra", reopened)
+        self.assertNotEqual(reopened.info("clip-extra")["shard"], reopened.info("clip-2")["shard"])
+
+    def test_invalid_input(self):
+        store = FeatureStore(self.root)
+        with store.writer() as writer:
+            with self.assertRaises(ValueError):
+                writer.append(1, {"rms": np.ones(3)})
+            with self.assertRaises(ValueError):
+                writer.append("clip", {"../rms": np.ones(3)})
+        with self.assertRaises(ValueError):
+            store.writer(codec="gzip")
+        store.refresh()
+        with self.assertRaises(KeyError):
+            store["missing"]
+
+
+if __name__ == "__main__":
+    unittest.main()
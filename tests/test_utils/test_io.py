@@ -1,3 +1,4 @@
+import importlib.util
 import unittest
 import tempfile
 import os
@@ -32,6 +33,90 @@ class TestIOUtils(unittest.TestCase):
             np.testing.assert_allclose(loaded["a"], features["a"])
             np.testing.assert_allclose(loaded["b"], features["b"])
 
+    def test_load_features_lazy(self):
+        rng = np.random.default_rng(0)
+        features = {f"feat{i}": rng.standard_normal((50, 3)).astype(np.float32) for i in range(20)}
+        features["fortran"] = np.asfortranarray(rng.standard_normal((4, 5)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stored = os.path.join(tmpdir, "stored.npz")
+            compressed = os.path.join(tmpdir, "compressed.npz")
+            np.savez(stored, **features)
+            np.savez_compressed(compressed, **features)
+
+            loaded = load_features(stored)
+            self.assertEqual(len(loaded), len(features))
+            self.assertIsInstance(loaded["feat3"], np.memmap)
+            for key, value in features.items():
+                np.testing.assert_array_equal(loaded[key], value)
+
+            subset = load_features(compressed, keys=["feat1", "feat7"])
+            self.assertIn("feat7", subset)
+            self.assertNotIn("feat2", subset)
+            self.assertEqual(subset._cache, {})
+            self.assertEqual(list(subset), ["feat1", "feat7"])
+            np.testing.assert_array_equal(subset["feat7"], features["feat7"])
+            self.assertNotIsInstance(subset["feat7"], np.memmap)
+
+            in_memory = load_features(stored, mmap=False)
+            self.assertNotIsInstance(in_memory["feat0"], np.memmap)
+            with self.assertRaises(KeyError):
+                load_features(stored, keys=["missing"])
+
+    def test_save_features_compression(self):
+        rng = np.random.default_rng(0)
+        features = {
+            "mfcc": rng.standard_normal((200, 13)).astype(np.float32),
+            "rms": rng.random((200, 1)).astype(np.float32),
+            "labels": np.arange(5)
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "features.npz")
+            for compression in ["none", "zlib", "fast"]:
+                save_features(features, path, compression=compression, level=1)
+                loaded = load_features(path)
+                self.assertEqual(list(loaded), list(features))
+                for key, value in features.items():
+                    self.assertEqual(loaded[key].dtype, value.dtype)
+                    np.testing.assert_array_equal(loaded[key], value)
+
+            save_features(features, path, compression="none")
+            self.assertIsInstance(load_features(path)["mfcc"], np.memmap)
+            with np.load(path) as data:
+                np.testing.assert_array_equal(data["rms"], features["rms"])
+
+            if importlib.util.find_spec("lz4") is None:
+                with self.assertWarns(UserWarning):
+                    save_features(features, path, compression="lz4")
+                np.testing.assert_array_equal(load_features(path)["mfcc"], features["mfcc"])
+
+            with self.assertRaises(ValueError):
+                save_features(features, path, compression="gzip")
+
+    def test_save_features_adds_suffix(self):
+        features = {"rms": np.ones((10, 1), dtype=np.float32)}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for compression in ["none", "zlib", "fast"]:
+                path = os.path.join(tmpdir, f"feat_{compression}")
+                save_features(features, path, compression=compression)
+                self.assertFalse(os.path.exists(path))
+                loaded = load_features(path + ".npz")
+                np.testing.assert_array_equal(loaded["rms"], features["rms"])
+
+    def test_save_features_float16(self):
+        rng = np.random.default_rng(1)
+        values = (rng.standard_normal((100, 20)) * 100.0).astype(np.float32)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "features.npz")
+            save_features({"mel": values}, path, compression="fast", dtype="float16")
+            loaded = load_features(path)["mel"]
+            self.assertEqual(loaded.dtype, np.float16)
+            mask = np.abs(values) >= 2.0 ** -14
+            relative = np.abs(loaded.astype(np.float32) - values)[mask] / np.abs(values[mask])
+            self.assertLessEqual(relative.max(), 2.0 ** -11)
+
+            with self.assertRaises(ValueError):
+                save_features({"mel": np.array([1e5])}, path, dtype="float16")
+
 
 if __name__ == "__main__":
     unittest.main()